@@ -4,17 +4,21 @@ Script to convert markdown manuscript to JAMA-compliant Word format.
 Handles proper formatting, spacing, and page numbering according to JAMA guidelines.
 """
 
+import io
 import os
 import re
 import sys
 import logging
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.section import WD_SECTION
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from xml.sax.saxutils import escape
 
 # Set up logging
 logging.basicConfig(
@@ -27,6 +31,123 @@ logging.basicConfig(
 )
 logger = logging.getLogger('jama_converter')
 
+# Markdown-cleaning patterns, compiled once at import time
+# (clean_markdown runs once per paragraph/reference/author). Bold and
+# italic stay separate sequential passes so nested markers
+# (***text***) strip completely.
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_LINK_RE = re.compile(r'\[(.*?)\]\(.*?\)')
+
+# Superscript citations (^12^) mostly appear in the author list, so they
+# get a dedicated pattern gated on a cheap caret check
+_SUP_RE = re.compile(r'\^(\d+)\^')
+
+# Maps lowercased '## ' heading text to the canonical section key
+_SECTION_KEYS = {
+    'title page': 'title_page',
+    'abstract': 'abstract',
+    'background': 'introduction',
+    'introduction': 'introduction',
+    'methods': 'methods',
+    'results': 'results',
+    'discussion': 'discussion',
+    'conclusions': 'conclusion',
+    'list of abbreviations': 'abbreviations',
+    'declarations': 'declarations',
+    'references': 'references',
+}
+
+# Reusable document templates carrying the JAMA page setup and styles;
+# built once and reopened per conversion. The manuscript template also
+# carries the PAGE header; the cover letter has never had page numbers,
+# so it gets its own header-free template.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_TEMPLATE_PATH = os.path.join(_SCRIPT_DIR, 'jama_template.docx')
+_COVER_TEMPLATE_PATH = os.path.join(_SCRIPT_DIR, 'jama_cover_template.docx')
+
+def setup_document_styles(doc):
+    """Set document-wide styles once so runs inherit them.
+
+    Setting the font on every run triggers an XML attribute write per run;
+    configuring the 'Normal' style (plus a double-spaced body style) up
+    front lets all paragraphs inherit the JAMA defaults for free.
+    """
+    normal = doc.styles['Normal']
+    normal.font.name = 'Times New Roman'
+    normal.font.size = Pt(12)
+
+    body = doc.styles.add_style('JAMABody', WD_STYLE_TYPE.PARAGRAPH)
+    body.base_style = normal
+    body.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
+    body.paragraph_format.space_after = Pt(0)
+    body.paragraph_format.first_line_indent = Inches(0.5)
+
+# Precompiled author-extraction patterns, shared by the title page and
+# the cover-letter signature block; names are comma-separated with
+# optional ^N^ affiliation superscripts
+_AUTHORS_RE = re.compile(r'\*\*Authors\*\*:\s*(.*?)(?=\n\n\*\*|\Z)', re.DOTALL)
+_AUTHOR_SUP_RE = re.compile(r'\^\d+\^')
+
+# Raw OXML for the PAGE field run used in headers; parsed in one go
+# instead of assembling fldChar/instrText elements one at a time
+_PAGE_FIELD_XML = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText>PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="end"/>'
+    '</w:r>'
+)
+
+# Prototype OXML node for a body paragraph in the JAMABody style;
+# deepcopied and filled per paragraph instead of re-running the
+# paragraph/run/format API for every body paragraph
+_BODY_P_TEMPLATE = parse_xml(
+    '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:pPr><w:pStyle w:val="JAMABody"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve"></w:t></w:r>'
+    '</w:p>'
+)
+
+# Raw OXML for one reference paragraph: double-spaced with a 0.5" hanging
+# indent (720 twips). Building these directly skips python-docx's per-call
+# wrapper objects, which dominate runtime on long reference lists
+_REFERENCE_P_XML = (
+    '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:pPr>'
+    '<w:spacing w:after="0" w:line="480" w:lineRule="auto"/>'
+    '<w:ind w:left="720" w:hanging="720"/>'
+    '</w:pPr>'
+    '<w:r><w:t xml:space="preserve">{}</w:t></w:r>'
+    '</w:p>'
+)
+
+# Hardcoded fallback cover letter, formerly duplicated in
+# create_jama_cover_letter.py; used when no markdown source is supplied
+DEFAULT_COVER_LETTER_PARAGRAPHS = [
+    "I am pleased to submit our manuscript \"Sex Representation Equity in Clinical Trials: A Statistical Analysis\" for consideration for publication in JAMA.",
+
+    "This study provides a novel statistical approach to evaluating sex representation in clinical trials by testing the null hypothesis that male and female participants are equally represented relative to population demographics. While previous research has primarily used descriptive approaches to document the presence or absence of women in trials, our analysis rigorously tests whether current representation levels achieve statistical equity.",
+
+    "Analyzing 1,825 clinical trials, we found:\n• No significant deviation from expected sex representation (50.8% female) across any disease category\n• Overall female representation of 50.1% (p = 0.844 compared to population expectation)\n• Successful achievement of equity even in historically problematic areas like HIV/AIDS research",
+
+    "We believe this manuscript is appropriate for JAMA for several reasons:\n• The findings have significant implications for research ethics and policy\n• The methodological approach provides a template for equity assessments across clinical research\n• The topic addresses JAMA's commitment to promoting diversity and equity in medical research\n• The findings will interest JAMA's broad readership of clinicians, researchers, and policymakers",
+
+    "The manuscript contains approximately 3,200 words, 2 tables, and 3 figures. It has not been published previously and is not under consideration by any other journal. All authors have reviewed the manuscript and agree with its contents and submission to JAMA. The authors have no conflicts of interest to declare.",
+
+    "All data used in the analysis is publicly available through ClinicalTrials.gov, and all code and methods are thoroughly documented in the supplementary materials to ensure reproducibility.",
+]
+
+DEFAULT_COVER_LETTER_CONTENT = (
+    "To: Editor-in-Chief\n"
+    "JAMA (Journal of the American Medical Association)\n"
+    "330 N. Wabash Ave, Suite 39300\n"
+    "Chicago, IL 60611-5885\n\n"
+    "Re: Manuscript Submission - Sex Representation Equity in Clinical Trials: A Statistical Analysis\n\n"
+    "Dear Editor-in-Chief:\n\n"
+    + "\n\n".join(DEFAULT_COVER_LETTER_PARAGRAPHS)
+)
+
 def add_page_numbers(doc):
     """Add page numbers to document in the upper right corner."""
     try:
@@ -35,88 +156,114 @@ def add_page_numbers(doc):
             header = section.header
             paragraph = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
             paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            
-            page_num = paragraph.add_run()
-            fldChar = OxmlElement('w:fldChar')
-            fldChar.set(qn('w:fldCharType'), 'begin')
-            
-            instrText = OxmlElement('w:instrText')
-            instrText.text = "PAGE"
-            
-            fldChar2 = OxmlElement('w:fldChar')
-            fldChar2.set(qn('w:fldCharType'), 'end')
-            
-            page_num._r.append(fldChar)
-            page_num._r.append(instrText)
-            page_num._r.append(fldChar2)
-            
-            # Set font properties for page numbers
-            page_num.font.name = 'Times New Roman'
-            page_num.font.size = Pt(12)
-        
+            paragraph._p.append(parse_xml(_PAGE_FIELD_XML))
+
         logger.info("Page numbers added successfully")
     except Exception as e:
-        logger.error(f"Error adding page numbers: {str(e)}")
+        logger.error("Error adding page numbers: %s", str(e))
         raise
 
-def count_words(text):
-    """Count words in text, excluding markdown formatting."""
-    # Remove markdown formatting
-    clean_text = clean_markdown(text)
-    # Count words
-    return len(re.findall(r'\S+', clean_text))
+def apply_page_setup(doc):
+    """Apply JAMA page size and 1-inch margins to the document."""
+    section = doc.sections[0]
+    section.page_height = Inches(11)
+    section.page_width = Inches(8.5)
+    section.left_margin = Inches(1)
+    section.right_margin = Inches(1)
+    section.top_margin = Inches(1)
+    section.bottom_margin = Inches(1)
+
+def new_jama_document(page_numbers=True):
+    """Open a new document from the JAMA template, building it if needed.
+
+    The templates ship with page setup and styles already applied, so
+    conversions skip the per-document mutation cost. The manuscript
+    template (the default) also carries the PAGE header; pass
+    page_numbers=False for documents without page numbers, such as the
+    cover letter.
+    """
+    template_path = _TEMPLATE_PATH if page_numbers else _COVER_TEMPLATE_PATH
+    if not os.path.exists(template_path):
+        doc = Document()
+        setup_document_styles(doc)
+        apply_page_setup(doc)
+        if page_numbers:
+            add_page_numbers(doc)
+        doc.save(template_path)
+        logger.info("Created JAMA document template at %s", template_path)
+    return Document(template_path)
+
+def extract_authors(manuscript_content):
+    """Extract the list of author names from manuscript markdown."""
+    authors_match = _AUTHORS_RE.search(manuscript_content)
+    if not authors_match:
+        return []
+    tokens = authors_match.group(1).split(',')
+    return [_AUTHOR_SUP_RE.sub('', token).strip() for token in tokens if token.strip()]
+
+def count_words(clean_text):
+    """Count words in text already stripped of markdown formatting."""
+    return len(clean_text.split())
 
 def clean_markdown(text):
     """Clean markdown formatting from text."""
-    # Remove bold markers
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-    # Remove italic markers
-    text = re.sub(r'\*(.*?)\*', r'\1', text)
-    # Remove reference links
-    text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)
-    # Remove superscript notation
-    text = re.sub(r'\^(\d+)\^', r'\1', text)
+    # Most body paragraphs carry no markup at all; skip the regex engine
+    # entirely when none of the metacharacters are present
+    if not any(c in text for c in '*[^\\'):
+        return text
+    # Remove bold, then italic, then link markers; each pass is gated
+    # on the metacharacter it needs
+    if '*' in text:
+        text = _BOLD_RE.sub(r'\1', text)
+        text = _ITALIC_RE.sub(r'\1', text)
+    if '[' in text:
+        text = _LINK_RE.sub(r'\1', text)
+    # Remove superscript notation only when a caret is actually present
+    if '^' in text:
+        text = _SUP_RE.sub(r'\1', text)
     # Clean up any remaining markdown artifacts
-    text = text.replace('\\', '')
+    if '\\' in text:
+        text = text.replace('\\', '')
     return text
 
-def split_into_sections(content):
-    """Split markdown content into labeled sections."""
+def split_into_sections(source):
+    """Split markdown content into labeled sections.
+
+    Accepts a string or an open file object; either way the content is
+    consumed line by line, accumulating one section buffer at a time so
+    peak memory tracks the largest section rather than the whole file.
+    """
     try:
+        if isinstance(source, str):
+            source = io.StringIO(source)
+
         sections = {}
-        
-        # Extract title
-        title_match = re.search(r'# (.*?)(?:\n|$)', content)
-        if title_match:
-            sections['title'] = title_match.group(1)
-        
-        # Extract sections using regex patterns
-        section_patterns = {
-            'title_page': r'## Title Page\s*\n(.*?)(?=\n##|\Z)',
-            'abstract': r'## Abstract\s*\n(.*?)(?=\n##|\Z)', 
-            'introduction': r'## (?:Background|Introduction)\s*\n(.*?)(?=\n##|\Z)',
-            'methods': r'## Methods\s*\n(.*?)(?=\n##|\Z)',
-            'results': r'## Results\s*\n(.*?)(?=\n##|\Z)',
-            'discussion': r'## Discussion\s*\n(.*?)(?=\n##|\Z)',
-            'conclusion': r'## Conclusions\s*\n(.*?)(?=\n##|\Z)',
-            'abbreviations': r'## List of abbreviations\s*\n(.*?)(?=\n##|\Z)',
-            'declarations': r'## Declarations\s*\n(.*?)(?=\n##|\Z)',
-            'references': r'## References\s*\n(.*?)(?=\n##|\Z)',
-        }
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                sections[section_name] = match.group(1).strip()
-        
-        logger.info(f"Successfully extracted {len(sections)} sections from manuscript")
+        current_key = None
+        buffer = []
+
+        def finalize_section():
+            if current_key is not None:
+                sections[current_key] = ''.join(buffer).strip()
+            buffer.clear()
+
+        for line in source:
+            if line.startswith('## '):
+                finalize_section()
+                current_key = _SECTION_KEYS.get(line[3:].strip().lower())
+            elif line.startswith('# ') and 'title' not in sections:
+                sections['title'] = line[2:].strip()
+            elif current_key is not None:
+                buffer.append(line)
+        finalize_section()
+
+        logger.info("Successfully extracted %s sections from manuscript", len(sections))
         return sections
-    
+
     except Exception as e:
-        logger.error(f"Error splitting markdown into sections: {str(e)}")
+        logger.error("Error splitting markdown into sections: %s", str(e))
         raise
 
-def process_title_page(doc, sections):
+def process_title_page(doc, sections, cleaned):
     """Process and format the title page according to JAMA requirements."""
     try:
         # Add title
@@ -125,22 +272,18 @@ def process_title_page(doc, sections):
         title_para.paragraph_format.space_after = Pt(12)
         title_run = title_para.add_run(sections.get('title', 'Untitled Manuscript'))
         title_run.font.bold = True
-        title_run.font.size = Pt(12)
-        title_run.font.name = 'Times New Roman'
         
         # Extract author information from title page
         if 'title_page' in sections:
             author_text = sections['title_page']
             
             # Process authors
-            authors_match = re.search(r'\*\*Authors\*\*:\s*(.*?)(?=\n\n\*\*|\Z)', author_text, re.DOTALL)
+            authors_match = _AUTHORS_RE.search(author_text)
             if authors_match:
                 authors_para = doc.add_paragraph()
                 authors_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 authors_para.paragraph_format.space_after = Pt(12)
                 authors_run = authors_para.add_run(clean_markdown(authors_match.group(1)))
-                authors_run.font.size = Pt(12)
-                authors_run.font.name = 'Times New Roman'
             
             # Process affiliations
             affil_match = re.search(r'\*\*Affiliations\*\*:\s*(.*?)(?=\n\n\*\*|\Z)', author_text, re.DOTALL)
@@ -149,8 +292,6 @@ def process_title_page(doc, sections):
                 affil_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 affil_para.paragraph_format.space_after = Pt(12)
                 affil_run = affil_para.add_run(clean_markdown(affil_match.group(1)))
-                affil_run.font.size = Pt(12)
-                affil_run.font.name = 'Times New Roman'
             
             # Process corresponding author
             corresp_match = re.search(r'\*\*Corresponding Author\*\*:\s*(.*?)(?=\n\n\*\*|\Z)', author_text, re.DOTALL)
@@ -159,30 +300,26 @@ def process_title_page(doc, sections):
                 corresp_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
                 corresp_para.paragraph_format.space_after = Pt(12)
                 corresp_run = corresp_para.add_run(clean_markdown(corresp_match.group(1)))
-                corresp_run.font.size = Pt(12)
-                corresp_run.font.name = 'Times New Roman'
         
         # Add word count (JAMA requirement)
         word_count = 0
         for section in ['introduction', 'methods', 'results', 'discussion', 'conclusion']:
-            if section in sections:
-                word_count += count_words(sections[section])
+            if section in cleaned:
+                word_count += count_words(cleaned[section])
         
         word_count_p = doc.add_paragraph()
         word_count_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         word_count_run = word_count_p.add_run(f"Word Count: {word_count}")
-        word_count_run.font.size = Pt(12)
-        word_count_run.font.name = 'Times New Roman'
         
         # Page break after title page
         doc.add_page_break()
         logger.info("Title page processed successfully")
         
     except Exception as e:
-        logger.error(f"Error processing title page: {str(e)}")
+        logger.error("Error processing title page: %s", str(e))
         raise
 
-def process_abstract_page(doc, sections):
+def process_abstract_page(doc, sections, cleaned):
     """Process and format the abstract page according to JAMA requirements."""
     try:
         if 'abstract' not in sections:
@@ -193,17 +330,13 @@ def process_abstract_page(doc, sections):
         abstract_title = doc.add_paragraph()
         abstract_title.alignment = WD_ALIGN_PARAGRAPH.CENTER
         abstract_title_run = abstract_title.add_run("ABSTRACT")
-        abstract_title_run.font.size = Pt(12)
         abstract_title_run.font.bold = True
-        abstract_title_run.font.name = 'Times New Roman'
         
         # Abstract word count
-        abstract_word_count = count_words(sections['abstract'])
+        abstract_word_count = count_words(cleaned['abstract'])
         abstract_count_p = doc.add_paragraph()
         abstract_count_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         abstract_count_run = abstract_count_p.add_run(f"Word Count: {abstract_word_count}")
-        abstract_count_run.font.size = Pt(12)
-        abstract_count_run.font.name = 'Times New Roman'
         
         # Abstract content
         try:
@@ -214,106 +347,86 @@ def process_abstract_page(doc, sections):
                 para.paragraph_format.space_after = Pt(0)
                 part_run = para.add_run(f"{part}: ")
                 part_run.font.bold = True
-                part_run.font.size = Pt(12)
-                part_run.font.name = 'Times New Roman'
                 
                 content_run = para.add_run(clean_markdown(content.strip()))
-                content_run.font.size = Pt(12)
-                content_run.font.name = 'Times New Roman'
         except Exception as e:
-            logger.error(f"Error processing structured abstract: {str(e)}")
+            logger.error("Error processing structured abstract: %s", str(e))
             # Add a simple paragraph if structured abstract parsing fails
             para = doc.add_paragraph()
             para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-            para_run = para.add_run(clean_markdown(sections['abstract']))
-            para_run.font.size = Pt(12)
-            para_run.font.name = 'Times New Roman'
+            para_run = para.add_run(cleaned['abstract'])
         
         # Page break after abstract
         doc.add_page_break()
         logger.info("Abstract page processed successfully")
         
     except Exception as e:
-        logger.error(f"Error processing abstract page: {str(e)}")
+        logger.error("Error processing abstract page: %s", str(e))
         raise
 
-def process_paragraphs(doc, sections):
-    """Process paragraphs with proper formatting for each section."""
+def process_paragraphs(doc, cleaned):
+    """Process pre-cleaned paragraphs with proper formatting for each section."""
     try:
         # Main content sections
         for section_name in ['introduction', 'methods', 'results', 'discussion', 'conclusion']:
-            if section_name in sections:
+            if section_name in cleaned:
                 heading = doc.add_paragraph()
                 heading.paragraph_format.space_before = Pt(12)
                 heading.paragraph_format.space_after = Pt(6)
                 heading_run = heading.add_run(section_name.capitalize())
                 heading_run.font.bold = True
-                heading_run.font.size = Pt(12)
-                heading_run.font.name = 'Times New Roman'
                 
-                # Split content into paragraphs and process each one
-                paragraphs = sections[section_name].split('\n\n')
-                for para_text in paragraphs:
-                    para = doc.add_paragraph()
-                    para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-                    para.paragraph_format.space_after = Pt(0)
-                    para.paragraph_format.first_line_indent = Inches(0.5)
-                    
-                    # Process any inline references or formatting
-                    cleaned_text = clean_markdown(para_text.strip())
-                    para_run = para.add_run(cleaned_text)
-                    para_run.font.size = Pt(12)
-                    para_run.font.name = 'Times New Roman'
+                # Emit each paragraph by cloning the prototype node and
+                # filling in its text, skipping the high-level API
+                sect_pr = doc.element.body.xpath('./w:sectPr')[0]
+                for para_text in cleaned[section_name].split('\n\n'):
+                    para = deepcopy(_BODY_P_TEMPLATE)
+                    para.xpath('.//w:t')[0].text = para_text.strip()
+                    sect_pr.addprevious(para)
 
         # Process abbreviations section if present
-        if 'abbreviations' in sections:
-            process_abbreviations_section(doc, sections['abbreviations'])
+        if 'abbreviations' in cleaned:
+            process_abbreviations_section(doc, cleaned['abbreviations'])
 
         # Process declarations section if present
-        if 'declarations' in sections:
-            process_declarations_section(doc, sections['declarations'])
+        if 'declarations' in cleaned:
+            process_declarations_section(doc, cleaned['declarations'])
 
         # Process references section if present
-        if 'references' in sections:
-            process_references_section(doc, sections['references'])
+        if 'references' in cleaned:
+            process_references_section(doc, cleaned['references'])
 
         logger.info("Paragraphs processed successfully")
     except Exception as e:
-        logger.error(f"Error processing paragraphs: {str(e)}")
+        logger.error("Error processing paragraphs: %s", str(e))
         raise
 
 def process_abbreviations_section(doc, content):
-    """Process the abbreviations section with proper formatting."""
+    """Process the pre-cleaned abbreviations section with proper formatting."""
     try:
         heading = doc.add_paragraph()
         heading.paragraph_format.space_before = Pt(12)
         heading.paragraph_format.space_after = Pt(6)
         heading_run = heading.add_run("List of Abbreviations")
         heading_run.font.bold = True
-        heading_run.font.size = Pt(12)
-        heading_run.font.name = 'Times New Roman'
         
         para = doc.add_paragraph()
         para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-        para_run = para.add_run(clean_markdown(content))
-        para_run.font.size = Pt(12)
-        para_run.font.name = 'Times New Roman'
-        
+        para_run = para.add_run(content)
+
         logger.info("Abbreviations section processed successfully")
     except Exception as e:
-        logger.error(f"Error processing abbreviations section: {str(e)}")
+        logger.error("Error processing abbreviations section: %s", str(e))
         raise
 
 def process_declarations_section(doc, content):
-    """Process the declarations section with proper formatting."""
+    """Process the pre-cleaned declarations section with proper formatting."""
     try:
         heading = doc.add_paragraph()
         heading.paragraph_format.space_before = Pt(12)
         heading.paragraph_format.space_after = Pt(6)
         heading_run = heading.add_run("Declarations")
         heading_run.font.bold = True
-        heading_run.font.size = Pt(12)
-        heading_run.font.name = 'Times New Roman'
         
         # Split declarations by sections
         declaration_sections = re.findall(r'### (.*?)\s*\n\n(.*?)(?=\n\n###|\Z)', content, re.DOTALL)
@@ -325,79 +438,60 @@ def process_declarations_section(doc, content):
             subheading.paragraph_format.left_indent = Inches(0.25)
             subheading_run = subheading.add_run(title)
             subheading_run.font.italic = True
-            subheading_run.font.size = Pt(12)
-            subheading_run.font.name = 'Times New Roman'
             
             para = doc.add_paragraph()
             para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
             para.paragraph_format.space_after = Pt(6)
             para.paragraph_format.left_indent = Inches(0.5)
-            para_run = para.add_run(clean_markdown(content.strip()))
-            para_run.font.size = Pt(12)
-            para_run.font.name = 'Times New Roman'
-        
+            para_run = para.add_run(content.strip())
+
         logger.info("Declarations section processed successfully")
     except Exception as e:
-        logger.error(f"Error processing declarations section: {str(e)}")
+        logger.error("Error processing declarations section: %s", str(e))
         raise
 
 def process_references_section(doc, content):
-    """Process the references section with proper formatting."""
+    """Process the pre-cleaned references section with proper formatting."""
     try:
         heading = doc.add_paragraph()
         heading.paragraph_format.space_before = Pt(12)
         heading.paragraph_format.space_after = Pt(6)
         heading_run = heading.add_run("References")
         heading_run.font.bold = True
-        heading_run.font.size = Pt(12)
-        heading_run.font.name = 'Times New Roman'
-        
-        # Process each reference
-        references = content.split('\n')
-        for ref in references:
-            if ref.strip():
-                para = doc.add_paragraph()
-                para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-                para.paragraph_format.space_after = Pt(0)
-                para.paragraph_format.left_indent = Inches(0.5)
-                para.paragraph_format.hanging_indent = Inches(0.5)
-                para_run = para.add_run(clean_markdown(ref.strip()))
-                para_run.font.size = Pt(12)
-                para_run.font.name = 'Times New Roman'
         
+        # Emit each reference paragraph as raw OXML in a single batch,
+        # bypassing python-docx's high-level paragraph/run API
+        sect_pr = doc.element.body.xpath('./w:sectPr')[0]
+        for ref in content.split('\n'):
+            ref = ref.strip()
+            if ref:
+                sect_pr.addprevious(parse_xml(_REFERENCE_P_XML.format(escape(ref))))
+
         logger.info("References section processed successfully")
     except Exception as e:
-        logger.error(f"Error processing references section: {str(e)}")
+        logger.error("Error processing references section: %s", str(e))
         raise
 
-def convert_cover_letter(input_file, output_dir):
-    """Convert cover letter from markdown to JAMA-compliant Word format."""
+def convert_cover_letter(content, authors, output_dir):
+    """Convert cover letter markdown content to JAMA-compliant Word format.
+
+    Falls back to the hardcoded default letter when no content is given.
+    """
     try:
+        if content is None:
+            content = DEFAULT_COVER_LETTER_CONTENT
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Read input markdown file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Create new Word document
-        doc = Document()
-        
-        # Set up document properties
-        section = doc.sections[0]
-        section.page_height = Inches(11)
-        section.page_width = Inches(8.5)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        
+
+        # Create new Word document from the shared template; the cover
+        # letter carries no page numbers
+        doc = new_jama_document(page_numbers=False)
+
         # Current date
         date_para = doc.add_paragraph()
         date_para.paragraph_format.space_after = Pt(24)
         date_run = date_para.add_run(datetime.datetime.now().strftime("%B %d, %Y"))
-        date_run.font.name = 'Times New Roman'
-        date_run.font.size = Pt(12)
         
         # Extract addressee information if present
         addressee_match = re.search(r'^\s*To:\s*(.*?)(?=\n\n|\Z)', content, re.MULTILINE | re.DOTALL)
@@ -406,11 +500,10 @@ def convert_cover_letter(input_file, output_dir):
             addressee_para.paragraph_format.space_after = Pt(24)
             addressee_text = clean_markdown(addressee_match.group(1).strip())
             addressee_run = addressee_para.add_run(addressee_text)
-            addressee_run.font.name = 'Times New Roman'
-            addressee_run.font.size = Pt(12)
             
-            # Remove addressee part from content
-            content = content.replace(addressee_match.group(0), '', 1)
+            # Remove addressee part from content by slicing at the known
+            # match offsets (no second substring search)
+            content = content[:addressee_match.start()] + content[addressee_match.end():]
         
         # Extract subject/RE line if present
         subject_match = re.search(r'^\s*Re:[ \t]*(.+?)$|^\s*Subject:[ \t]*(.+?)$', content, re.MULTILINE)
@@ -420,15 +513,14 @@ def convert_cover_letter(input_file, output_dir):
             subject_para.paragraph_format.space_after = Pt(24)
             subject_run = subject_para.add_run(f"Re: {clean_markdown(subject_text.strip())}")
             subject_run.font.bold = True
-            subject_run.font.name = 'Times New Roman'
-            subject_run.font.size = Pt(12)
             
-            # Remove subject line from content
-            content = content.replace(subject_match.group(0), '', 1)
+            # Remove subject line from content by slicing at the match offsets
+            content = content[:subject_match.start()] + content[subject_match.end():]
             
-        # Extract and clean content paragraphs
-        paragraphs = re.split(r'\n\n+', content.strip())
-        
+        # Extract and clean content paragraphs; blank-line runs split to
+        # empty strings, which the strip() filter below discards
+        paragraphs = content.strip().split('\n\n')
+
         # Process each paragraph
         for para_text in paragraphs:
             if para_text.strip():
@@ -437,103 +529,71 @@ def convert_cover_letter(input_file, output_dir):
                 para.paragraph_format.space_after = Pt(12)
                 para.paragraph_format.first_line_indent = Inches(0.5)
                 para_run = para.add_run(clean_markdown(para_text.strip()))
-                para_run.font.name = 'Times New Roman'
-                para_run.font.size = Pt(12)
         
         # Add signature block
         sig_para = doc.add_paragraph()
         sig_para.paragraph_format.space_before = Pt(24)
         sig_para.paragraph_format.space_after = Pt(18)
         sig_run = sig_para.add_run("Sincerely,")
-        sig_run.font.name = 'Times New Roman'
-        sig_run.font.size = Pt(12)
         
-        # Extract author names from manuscript
-        manuscript_path = os.path.join(os.path.dirname(input_file), "manuscript_equity_focus.md")
-        try:
-            with open(manuscript_path, 'r', encoding='utf-8') as f:
-                manuscript_content = f.read()
-                
-            # Extract author names
-            authors_match = re.search(r'\*\*Authors\*\*:\s*(.*?)(?=\n\n\*\*|\Z)', manuscript_content, re.DOTALL)
-            if authors_match:
-                authors_text = authors_match.group(1)
-                # Extract individual authors
-                author_list = re.findall(r'([^,^]+)(?:\^\d+\^)?(?:,|\Z)', authors_text)
-                
-                # Add each author signature
-                for author in author_list:
-                    author_name = author.strip()
-                    author_sig = doc.add_paragraph()
-                    author_sig.paragraph_format.space_after = Pt(0)
-                    author_run = author_sig.add_run(author_name)
-                    author_run.font.name = 'Times New Roman'
-                    author_run.font.size = Pt(12)
-        except Exception as e:
-            # If can't extract authors, add a generic signature line
+        # Add each author signature from the pre-extracted author list
+        if authors:
+            for author_name in authors:
+                author_sig = doc.add_paragraph()
+                author_sig.paragraph_format.space_after = Pt(0)
+                author_run = author_sig.add_run(author_name)
+        else:
+            # If no authors were extracted, add a generic signature line
             author_sig = doc.add_paragraph()
             author_sig.paragraph_format.space_before = Pt(36)
             author_run = author_sig.add_run("_______________________")
-            author_run.font.name = 'Times New Roman'
-            author_run.font.size = Pt(12)
         
         # Save the document
         output_file = os.path.join(output_dir, 'cover_letter.docx')
         doc.save(output_file)
         
-        logger.info(f"Cover letter successfully converted and saved to {output_file}")
+        logger.info("Cover letter successfully converted and saved to %s", output_file)
         return output_file
     
     except Exception as e:
-        logger.error(f"Error converting cover letter: {str(e)}")
+        logger.error("Error converting cover letter: %s", str(e))
         raise
 
-def convert_to_jama_format(input_file, output_dir):
-    """Main function to convert markdown to JAMA-compliant Word format."""
+def convert_to_jama_format(content, output_dir):
+    """Main function to convert manuscript markdown content to JAMA-compliant Word format."""
     try:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Read input markdown file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
+
         # Split content into sections
         sections = split_into_sections(content)
+
+        # Clean each section once up front; word counting and rendering
+        # both reuse these instead of re-cleaning the same text
+        cleaned = {name: clean_markdown(text) for name, text in sections.items()}
         
-        # Create new Word document
-        doc = Document()
-        
-        # Set up document properties
-        section = doc.sections[0]
-        section.page_height = Inches(11)
-        section.page_width = Inches(8.5)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        
-        # Add page numbers
-        add_page_numbers(doc)
-        
+        # Create new Word document from the shared template (page setup
+        # and page numbers are already applied there)
+        doc = new_jama_document()
+
         # Process title page
-        process_title_page(doc, sections)
-        
+        process_title_page(doc, sections, cleaned)
+
         # Process abstract
-        process_abstract_page(doc, sections)
-        
+        process_abstract_page(doc, sections, cleaned)
+
         # Process main content
-        process_paragraphs(doc, sections)
+        process_paragraphs(doc, cleaned)
         
         # Save the document
         output_file = os.path.join(output_dir, 'manuscript_jama.docx')
         doc.save(output_file)
         
-        logger.info(f"Document successfully converted and saved to {output_file}")
+        logger.info("Document successfully converted and saved to %s", output_file)
         return output_file
     
     except Exception as e:
-        logger.error(f"Error converting document: {str(e)}")
+        logger.error("Error converting document: %s", str(e))
         raise
 
 if __name__ == "__main__":
@@ -550,20 +610,30 @@ if __name__ == "__main__":
         os.makedirs(output_dir, exist_ok=True)
         
         logger.info("Starting JAMA document conversion")
-        
-        # Convert the manuscript
-        logger.info("Converting manuscript...")
-        manuscript_output = convert_to_jama_format(manuscript_input, output_dir)
+
+        # Read each input once; the author list extracted here is shared
+        # with the cover letter instead of re-reading the manuscript there
+        with open(manuscript_input, 'r', encoding='utf-8') as f:
+            manuscript_content = f.read()
+        with open(cover_letter_input, 'r', encoding='utf-8') as f:
+            cover_letter_content = f.read()
+        authors = extract_authors(manuscript_content)
+
+        # Convert the manuscript and cover letter concurrently; each builds
+        # its own Document, so the two conversions are independent
+        logger.info("Converting manuscript and cover letter...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            manuscript_future = executor.submit(convert_to_jama_format, manuscript_content, output_dir)
+            cover_letter_future = executor.submit(convert_cover_letter, cover_letter_content, authors, output_dir)
+            manuscript_output = manuscript_future.result()
+            cover_letter_output = cover_letter_future.result()
+
         print(f"Successfully created JAMA-formatted manuscript at: {manuscript_output}")
-        
-        # Convert the cover letter
-        logger.info("Converting cover letter...")
-        cover_letter_output = convert_cover_letter(cover_letter_input, output_dir)
         print(f"Successfully created JAMA-formatted cover letter at: {cover_letter_output}")
-        
+
         logger.info("All documents converted successfully")
         
     except Exception as e:
-        logger.error(f"Script execution failed: {str(e)}")
+        logger.error("Script execution failed: %s", str(e))
         print(f"Error: {str(e)}")
         sys.exit(1)
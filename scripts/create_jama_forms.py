@@ -2,11 +2,30 @@
 # Script to create JAMA submission form templates
 # Creates individual files for each author
 import os
+import docx
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+import concurrent.futures
+from copy import deepcopy
 import datetime
+import io
+import multiprocessing
 import logging
+import shutil
+
+# Length constants shared across the documents; Pt/Inches re-run
+# the EMU conversion on every call, so convert each value once
+IN_1 = Inches(1)
+IN_11 = Inches(11)
+IN_85 = Inches(8.5)
+IN_HALF = Inches(0.5)
+IN_QUARTER = Inches(0.25)
+PT12 = Pt(12)
+PT24 = Pt(24)
+PT6 = Pt(6)
 
 # Set up logging
 logging.basicConfig(
@@ -41,293 +60,376 @@ authors = [
     }
 ]
 
+# Derive each author's last name once; it names that author's files in
+# both create_* functions and the verification set below
+for _author in authors:
+    _author['last_name'] = _author['name'].rsplit(None, 1)[-1]
+    _author['info_block'] = (f"Author: {_author['name']}\n"
+                             f"Affiliation: {_author['affiliation']}\n"
+                             f"Email: {_author['email']}")
+
+# Every file main() is expected to leave in forms_dir
+_EXPECTED_FILES = frozenset(
+    [f"author_contribution_{a['last_name']}.docx" for a in authors] +
+    [f"icmje_disclosure_{a['last_name']}.docx" for a in authors] +
+    ['copyright_transfer_agreement.docx']
+)
+
+# python-docx re-reads and re-parses its default.docx package data on
+# every bare Document() call; cache the bytes once and seed each new
+# document from memory instead
+with open(os.path.join(docx.__path__[0], 'templates', 'default.docx'),
+          'rb') as _template_file:
+    _DEFAULT_TEMPLATE_BYTES = _template_file.read()
+
+def _new_doc():
+    return Document(io.BytesIO(_DEFAULT_TEMPLATE_BYTES))
+
 # Manuscript details
 manuscript_title = "Sex Representation Equity in Clinical Trials: A Statistical Analysis"
 manuscript_id = "JAMA-" + datetime.datetime.now().strftime('%Y-%m-%d')
 
-# Function to create the author contribution form for a single author
-def create_author_contribution_form(author):
-    doc = Document()
-    
-    # Extract last name for file naming
-    last_name = author['name'].split()[-1]
-    
-    # Set document properties
+# Shared header block, built once rather than re-formatted per document
+manuscript_info = f"Manuscript Title: {manuscript_title}\nManuscript ID: {manuscript_id}"
+
+# Copyright transfer agreement text; the warranties are kept as a list so
+# each clause becomes its own paragraph and the numbering stays automatic
+AGREEMENT_PREAMBLE = (
+    "The undersigned authors hereby transfer, assign, or otherwise convey all copyright "
+    "ownership, including any and all rights incidental thereto, exclusively to the "
+    "American Medical Association (AMA), in the event that such work is published in JAMA. "
+    "This agreement is binding on the authors, their heirs, and the AMA."
+)
+
+WARRANTIES = (
+    "The manuscript is original, has not been previously published, and is not under consideration "
+    "for publication elsewhere.",
+    "They are the sole authors and owners of the manuscript and have full authority to enter into "
+    "this agreement.",
+    "The manuscript does not infringe upon any copyright, proprietary right, or any other right "
+    "of any third party.",
+    "The manuscript contains no material that is defamatory, violates any right of privacy, or is "
+    "otherwise contrary to law.",
+    "They have made a significant scientific contribution to the study and approved the final version.",
+    "If the manuscript was prepared jointly with other authors, they have informed the co-author(s) "
+    "of the terms of this agreement and are signing on their behalf.",
+)
+
+AGREEMENT_CLOSING = (
+    "The authors understand that if the manuscript is accepted for publication, they will be required to "
+    "pay the publication fees as determined by the journal."
+)
+
+# Fixed form text, frozen at module level so the skeleton builders never
+# reconstruct it
+_CRITERIA = (
+    "Substantial contributions to the conception or design of the work; or the acquisition, analysis, or interpretation of data for the work; AND",
+    "Drafting the work or revising it critically for important intellectual content; AND",
+    "Final approval of the version to be published; AND",
+    "Agreement to be accountable for all aspects of the work in ensuring that questions related to the accuracy or integrity of any part of the work are appropriately investigated and resolved.",
+)
+
+_CONTRIBUTION_CATEGORIES = (
+    "Conception or design",
+    "Acquisition of data",
+    "Analysis or interpretation of data",
+    "Drafting the manuscript",
+    "Critical revision of the manuscript",
+    "Statistical analysis",
+    "Obtaining funding",
+    "Administrative or technical support",
+    "Supervision",
+)
+
+_DISCLOSURE_SECTIONS = (
+    "1. Financial relationships with industry",
+    "2. Academic or institutional affiliations",
+    "3. Research support or funding",
+    "4. Intellectual property rights",
+    "5. Personal relationships",
+    "6. Other potential conflicts of interest",
+)
+
+# Helper to add a paragraph with all formatting applied in one pass,
+# instead of repeating the run/font attribute assignments per paragraph
+def add_styled_paragraph(doc, text, size=None, bold=False, italic=False,
+                         font=None, align=None,
+                         space_before=None, space_after=None,
+                         left_indent=None, line_spacing=None):
+    para = doc.add_paragraph()
+    fmt = para.paragraph_format
+    if align is not None:
+        para.alignment = align
+    if space_before is not None:
+        fmt.space_before = space_before
+    if space_after is not None:
+        fmt.space_after = space_after
+    if left_indent is not None:
+        fmt.left_indent = left_indent
+    if line_spacing is not None:
+        fmt.line_spacing_rule = line_spacing
+    run = para.add_run(text)
+    run_font = run.font
+    # 12pt Times New Roman comes from the Normal style; only write font
+    # attributes for the rare overrides (14pt titles, 10pt code)
+    if size is not None:
+        run_font.size = Pt(size)
+    if font is not None:
+        run_font.name = font
+    if bold:
+        run_font.bold = True
+    if italic:
+        run_font.italic = True
+    return para
+
+# Apply US-letter page size with one-inch margins; every document the
+# script produces uses the same setup
+def _set_letter_margins(doc):
     section = doc.sections[0]
-    section.page_height = Inches(11)
-    section.page_width = Inches(8.5)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
-    
+    section.page_height = IN_11
+    section.page_width = IN_85
+    section.left_margin = section.right_margin = IN_1
+    section.top_margin = section.bottom_margin = IN_1
+
+# Default font applied once per document so runs inherit it
+def set_default_font(doc):
+    normal = doc.styles['Normal']
+    normal.font.name = 'Times New Roman'
+    normal.font.size = PT12
+    normal.element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
+
+# Placeholder text marking the author-specific paragraph in the skeletons
+_AUTHOR_INFO_SENTINEL = '{{AUTHOR_INFO}}'
+
+# Prototype OXML for the repeated list paragraphs (half-inch indent,
+# 6pt space after). Cloning a parsed <w:p> and swapping its text skips
+# the add_paragraph/add_run property-setter machinery for bulk items.
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+_LIST_P_TEMPLATE = parse_xml(
+    f'<w:p {_W_NS}>'
+    '<w:pPr><w:spacing w:after="120"/><w:ind w:left="720"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve"/></w:r></w:p>'
+)
+
+_SECTION_HEAD_P_TEMPLATE = parse_xml(
+    f'<w:p {_W_NS}>'
+    '<w:pPr><w:spacing w:before="240" w:after="120"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve"/></w:r></w:p>'
+)
+
+# The disclosure response and explanation paragraphs are constant text,
+# so their prototypes are cloned verbatim
+_RESPONSE_P_TEMPLATE = parse_xml(
+    f'<w:p {_W_NS}>'
+    '<w:pPr><w:spacing w:after="240"/><w:ind w:left="720"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">□ No</w:t><w:br/>'
+    '<w:t xml:space="preserve">□ Yes (explain below)</w:t></w:r></w:p>'
+)
+
+_EXPLAIN_P_TEMPLATE = parse_xml(
+    f'<w:p {_W_NS}>'
+    '<w:pPr><w:spacing w:after="240"/><w:ind w:left="720"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">If yes, please explain: '
+    '_____________________________________________</w:t></w:r></w:p>'
+)
+
+# Clone a prototype paragraph into the document body, keeping it ahead
+# of the trailing sectPr, and optionally set its text
+def _append_paragraph_xml(doc, template, text=None):
+    para = deepcopy(template)
+    if text is not None:
+        para.xpath('.//w:t')[0].text = text
+    body = doc.element.body
+    sect_pr = body.xpath('./w:sectPr')
+    if sect_pr:
+        sect_pr[0].addprevious(para)
+    else:
+        body.append(para)
+    return para
+
+# Start a blank form document with the shared page setup, title and
+# manuscript/author header paragraphs already in place
+def _new_form_document(title):
+    doc = _new_doc()
+    set_default_font(doc)
+
+    _set_letter_margins(doc)
+
     # Add title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run("JAMA AUTHOR CONTRIBUTION FORM")
-    title_run.font.size = Pt(14)
-    title_run.font.bold = True
-    title_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, title,
+                         size=14, bold=True, align=WD_ALIGN_PARAGRAPH.CENTER)
+
     # Add manuscript information
-    info = doc.add_paragraph()
-    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    info_run = info.add_run(f"Manuscript Title: {manuscript_title}\nManuscript ID: {manuscript_id}")
-    info_run.font.size = Pt(12)
-    info_run.font.name = 'Times New Roman'
-    
-    # Add author information
-    author_info = doc.add_paragraph()
-    author_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    author_info_run = author_info.add_run(f"Author: {author['name']}\nAffiliation: {author['affiliation']}\nEmail: {author['email']}")
-    author_info_run.font.size = Pt(12)
-    author_info_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, manuscript_info,
+                         align=WD_ALIGN_PARAGRAPH.CENTER)
+
+    # Author information placeholder, filled in per author
+    add_styled_paragraph(doc, _AUTHOR_INFO_SENTINEL,
+                         align=WD_ALIGN_PARAGRAPH.CENTER)
+
+    return doc
+
+# Replace the sentinel paragraph with the actual author details
+def _fill_author_info(doc, author):
+    for para in doc.paragraphs:
+        if para.runs and para.runs[0].text == _AUTHOR_INFO_SENTINEL:
+            para.runs[0].text = author['info_block']
+            return
+    raise ValueError("author info placeholder not found in form skeleton")
+
+# Build the contribution form skeleton once; everything except the
+# author paragraph is identical across authors, so each form is a
+# deepcopy of this document rather than a rebuild from scratch
+def _contribution_skeleton():
+    doc = _new_form_document("JAMA AUTHOR CONTRIBUTION FORM")
+
     # Add instructions
-    instructions = doc.add_paragraph()
-    instructions.paragraph_format.space_before = Pt(12)
-    instructions.paragraph_format.space_after = Pt(12)
-    instructions_run = instructions.add_run("The International Committee of Medical Journal Editors (ICMJE) recommends that authorship be based on the following 4 criteria:")
-    instructions_run.font.size = Pt(12)
-    instructions_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "The International Committee of Medical Journal Editors (ICMJE) recommends that authorship be based on the following 4 criteria:",
+                         space_before=PT12, space_after=PT12)
+
     # Add criteria
-    criteria = [
-        "Substantial contributions to the conception or design of the work; or the acquisition, analysis, or interpretation of data for the work; AND",
-        "Drafting the work or revising it critically for important intellectual content; AND",
-        "Final approval of the version to be published; AND",
-        "Agreement to be accountable for all aspects of the work in ensuring that questions related to the accuracy or integrity of any part of the work are appropriately investigated and resolved."
-    ]
-    
-    for criterion in criteria:
-        item = doc.add_paragraph()
-        item.paragraph_format.left_indent = Inches(0.5)
-        item.paragraph_format.space_after = Pt(6)
-        item_run = item.add_run(criterion)
-        item_run.font.size = Pt(12)
-        item_run.font.name = 'Times New Roman'
-    
+    for criterion in _CRITERIA:
+        _append_paragraph_xml(doc, _LIST_P_TEMPLATE, criterion)
+
     doc.add_paragraph()
-    
-    note = doc.add_paragraph()
-    note.paragraph_format.space_before = Pt(12)
-    note.paragraph_format.space_after = Pt(12)
-    note_run = note.add_run("Please check the appropriate boxes below and sign at the bottom.")
-    note_run.font.size = Pt(12)
-    note_run.font.italic = True
-    note_run.font.name = 'Times New Roman'
-    
+
+    add_styled_paragraph(doc, "Please check the appropriate boxes below and sign at the bottom.",
+                         italic=True, space_before=PT12, space_after=PT12)
+
     # Create contribution checklist
-    contribution_categories = [
-        "Conception or design",
-        "Acquisition of data",
-        "Analysis or interpretation of data",
-        "Drafting the manuscript",
-        "Critical revision of the manuscript",
-        "Statistical analysis",
-        "Obtaining funding",
-        "Administrative or technical support",
-        "Supervision"
-    ]
-    
-    for category in contribution_categories:
-        contribution = doc.add_paragraph()
-        contribution.paragraph_format.left_indent = Inches(0.5)
-        contribution.paragraph_format.space_after = Pt(6)
-        contribution_run = contribution.add_run(f"□ {category}")
-        contribution_run.font.size = Pt(12)
-        contribution_run.font.name = 'Times New Roman'
-    
+    for category in _CONTRIBUTION_CATEGORIES:
+        _append_paragraph_xml(doc, _LIST_P_TEMPLATE, f"□ {category}")
+
     # Signature line
-    signature = doc.add_paragraph()
-    signature.paragraph_format.space_before = Pt(24)
-    signature.paragraph_format.space_after = Pt(12)
-    signature_run = signature.add_run("Signature: __________________________________ Date: _______________")
-    signature_run.font.size = Pt(12)
-    signature_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "Signature: __________________________________ Date: _______________",
+                         space_before=PT24, space_after=PT12)
+
+    return doc
+
+# Build the ICMJE disclosure form skeleton once (see _contribution_skeleton)
+def _icmje_skeleton():
+    doc = _new_form_document("ICMJE DISCLOSURE FORM")
+
+    # Add disclosure sections
+    for section in _DISCLOSURE_SECTIONS:
+        # Section title
+        _append_paragraph_xml(doc, _SECTION_HEAD_P_TEMPLATE, section)
+
+        # Response options and explanation space are constant text, so
+        # their prototypes are cloned verbatim
+        _append_paragraph_xml(doc, _RESPONSE_P_TEMPLATE)
+        _append_paragraph_xml(doc, _EXPLAIN_P_TEMPLATE)
+
+    # Signature line
+    add_styled_paragraph(doc, "Signature: __________________________________ Date: _______________",
+                         space_before=PT24, space_after=PT12)
+
+    return doc
+
+# Serialize a skeleton once so per-author copies are cheap reopens of
+# the cached bytes. (Deep-copying a whole Document object does not work:
+# the document and part element trees end up as divergent copies, so
+# edits never reach the saved file.)
+def _serialize_skeleton(doc):
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+# Skeletons are built lazily on first use and reused for every author
+_CONTRIBUTION_SKELETON = None
+_ICMJE_SKELETON = None
+
+# Function to create the author contribution form for a single author
+def create_author_contribution_form(author):
+    global _CONTRIBUTION_SKELETON
+    if _CONTRIBUTION_SKELETON is None:
+        _CONTRIBUTION_SKELETON = _serialize_skeleton(_contribution_skeleton())
+
+    last_name = author['last_name']
+
+    # Copy the prebuilt skeleton and fill in the author details
+    doc = Document(io.BytesIO(_CONTRIBUTION_SKELETON))
+    _fill_author_info(doc, author)
+
     # Save the document with author-specific filename
     file_path = os.path.join(forms_dir, f'author_contribution_{last_name}.docx')
     doc.save(file_path)
     logger.info(f"Author Contribution Form created for {last_name}")
-    print(f"Author Contribution Form created for {last_name}")
     return file_path
 
 # Function to create the ICMJE disclosure form for a single author
 def create_icmje_disclosure_form(author):
     """Create ICMJE disclosure form for a single author."""
-    doc = Document()
-    
-    # Extract last name for file naming
-    last_name = author['name'].split()[-1]
-    
-    # Set document properties
-    section = doc.sections[0]
-    section.page_height = Inches(11)
-    section.page_width = Inches(8.5)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
-    
-    # Add title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run("ICMJE DISCLOSURE FORM")
-    title_run.font.size = Pt(14)
-    title_run.font.bold = True
-    title_run.font.name = 'Times New Roman'
-    
-    # Add manuscript information
-    info = doc.add_paragraph()
-    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    info_run = info.add_run(f"Manuscript Title: {manuscript_title}\nManuscript ID: {manuscript_id}")
-    info_run.font.size = Pt(12)
-    info_run.font.name = 'Times New Roman'
-    
-    # Add author information
-    author_info = doc.add_paragraph()
-    author_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    author_info_run = author_info.add_run(f"Author: {author['name']}\nAffiliation: {author['affiliation']}\nEmail: {author['email']}")
-    author_info_run.font.size = Pt(12)
-    author_info_run.font.name = 'Times New Roman'
-    
-    # Add disclosure sections
-    disclosure_sections = [
-        "1. Financial relationships with industry",
-        "2. Academic or institutional affiliations",
-        "3. Research support or funding",
-        "4. Intellectual property rights",
-        "5. Personal relationships",
-        "6. Other potential conflicts of interest"
-    ]
-    
-    for section in disclosure_sections:
-        # Section title
-        section_title = doc.add_paragraph()
-        section_title.paragraph_format.space_before = Pt(12)
-        section_title.paragraph_format.space_after = Pt(6)
-        section_title_run = section_title.add_run(section)
-        section_title_run.font.size = Pt(12)
-        section_title_run.font.name = 'Times New Roman'
-        
-        # Response options
-        response = doc.add_paragraph()
-        response.paragraph_format.left_indent = Inches(0.5)
-        response.paragraph_format.space_after = Pt(12)
-        response_run = response.add_run("□ No\n□ Yes (explain below)")
-        response_run.font.size = Pt(12)
-        response_run.font.name = 'Times New Roman'
-        
-        # Explanation space
-        explanation = doc.add_paragraph()
-        explanation.paragraph_format.left_indent = Inches(0.5)
-        explanation.paragraph_format.space_after = Pt(12)
-        explanation_run = explanation.add_run("If yes, please explain: _____________________________________________")
-        explanation_run.font.size = Pt(12)
-        explanation_run.font.name = 'Times New Roman'
-    
-    # Signature line
-    signature = doc.add_paragraph()
-    signature.paragraph_format.space_before = Pt(24)
-    signature.paragraph_format.space_after = Pt(12)
-    signature_run = signature.add_run("Signature: __________________________________ Date: _______________")
-    signature_run.font.size = Pt(12)
-    signature_run.font.name = 'Times New Roman'
-    
+    global _ICMJE_SKELETON
+    if _ICMJE_SKELETON is None:
+        _ICMJE_SKELETON = _serialize_skeleton(_icmje_skeleton())
+
+    last_name = author['last_name']
+
+    # Copy the prebuilt skeleton and fill in the author details
+    doc = Document(io.BytesIO(_ICMJE_SKELETON))
+    _fill_author_info(doc, author)
+
     # Save the document with author-specific filename
     file_path = os.path.join(forms_dir, f'icmje_disclosure_{last_name}.docx')
     doc.save(file_path)
     logger.info(f"ICMJE Disclosure Form created for {last_name}")
-    print(f"ICMJE Disclosure Form created for {last_name}")
     return file_path
 
 # Function to create the copyright transfer agreement
 def create_copyright_agreement():
-    doc = Document()
+    doc = _new_doc()
+    set_default_font(doc)
     
-    # Set document properties
-    section = doc.sections[0]
-    section.page_height = Inches(11)
-    section.page_width = Inches(8.5)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
+    _set_letter_margins(doc)
     
     # Add title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run("COPYRIGHT TRANSFER AGREEMENT")
-    title_run.font.size = Pt(14)
-    title_run.font.bold = True
-    title_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "COPYRIGHT TRANSFER AGREEMENT",
+                         size=14, bold=True, align=WD_ALIGN_PARAGRAPH.CENTER)
+
     # Add manuscript information
-    info = doc.add_paragraph()
-    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    info_run = info.add_run(f"Manuscript Title: {manuscript_title}\nManuscript ID: {manuscript_id}")
-    info_run.font.size = Pt(12)
-    info_run.font.name = 'Times New Roman'
-    
-    # Add agreement text
-    agreement_text = (
-        "The undersigned authors hereby transfer, assign, or otherwise convey all copyright "
-        "ownership, including any and all rights incidental thereto, exclusively to the "
-        "American Medical Association (AMA), in the event that such work is published in JAMA. "
-        "This agreement is binding on the authors, their heirs, and the AMA.\n\n"
-        "The authors represent and warrant that:\n"
-        "1. The manuscript is original, has not been previously published, and is not under consideration "
-        "for publication elsewhere.\n"
-        "2. They are the sole authors and owners of the manuscript and have full authority to enter into "
-        "this agreement.\n"
-        "3. The manuscript does not infringe upon any copyright, proprietary right, or any other right "
-        "of any third party.\n"
-        "4. The manuscript contains no material that is defamatory, violates any right of privacy, or is "
-        "otherwise contrary to law.\n"
-        "5. They have made a significant scientific contribution to the study and approved the final version.\n"
-        "6. If the manuscript was prepared jointly with other authors, they have informed the co-author(s) "
-        "of the terms of this agreement and are signing on their behalf.\n\n"
-        "The authors understand that if the manuscript is accepted for publication, they will be required to "
-        "pay the publication fees as determined by the journal."
-    )
-    
-    agreement = doc.add_paragraph()
-    agreement.paragraph_format.space_before = Pt(12)
-    agreement.paragraph_format.space_after = Pt(12)
-    agreement.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-    agreement_run = agreement.add_run(agreement_text)
-    agreement_run.font.size = Pt(12)
-    agreement_run.font.name = 'Times New Roman'
+    add_styled_paragraph(doc, manuscript_info,
+                         align=WD_ALIGN_PARAGRAPH.CENTER)
     
+    # Add agreement text, one paragraph per clause so no single run
+    # carries the whole agreement
+    add_styled_paragraph(doc, AGREEMENT_PREAMBLE,
+                         space_before=PT12, space_after=PT12,
+                         line_spacing=WD_LINE_SPACING.DOUBLE)
+
+    add_styled_paragraph(doc, "The authors represent and warrant that:",
+                         space_after=PT6,
+                         line_spacing=WD_LINE_SPACING.DOUBLE)
+
+    for i, warranty in enumerate(WARRANTIES, start=1):
+        add_styled_paragraph(doc, f"{i}. {warranty}",
+                             left_indent=IN_QUARTER, space_after=PT6,
+                             line_spacing=WD_LINE_SPACING.DOUBLE)
+
+    add_styled_paragraph(doc, AGREEMENT_CLOSING,
+                         space_before=PT6, space_after=PT12,
+                         line_spacing=WD_LINE_SPACING.DOUBLE)
+
     # Add signature sections for each author
-    for author in authors:
+    last_index = len(authors) - 1
+    for i, author in enumerate(authors):
         # Author name and signature line
-        signature = doc.add_paragraph()
-        signature.paragraph_format.space_before = Pt(12)
-        signature.paragraph_format.space_after = Pt(6)
-        signature_text = f"Author Name: {author['name']}\nAffiliation: {author['affiliation']}\nEmail: {author['email']}"
-        signature_run = signature.add_run(signature_text)
-        signature_run.font.size = Pt(12)
-        signature_run.font.name = 'Times New Roman'
-        
+        add_styled_paragraph(doc, f"Author Name: {author['name']}\nAffiliation: {author['affiliation']}\nEmail: {author['email']}",
+                             space_before=PT12, space_after=PT6)
+
         # Signature line
-        sig_line = doc.add_paragraph()
-        sig_line.paragraph_format.space_before = Pt(24)
-        sig_line.paragraph_format.space_after = Pt(12)
-        sig_line_run = sig_line.add_run("Signature: __________________________________ Date: _______________")
-        sig_line_run.font.size = Pt(12)
-        sig_line_run.font.name = 'Times New Roman'
+        add_styled_paragraph(doc, "Signature: __________________________________ Date: _______________",
+                             space_before=PT24, space_after=PT12)
         
         # Page break between authors (except for the last author)
-        if author != authors[-1]:
+        if i < last_index:
             doc.add_page_break()
     
     # Save the document
     file_path = os.path.join(forms_dir, 'copyright_transfer_agreement.docx')
     doc.save(file_path)
     logger.info(f"Created copyright transfer agreement")
-    print(f"Copyright Transfer Agreement created and saved to {file_path}")
     return file_path
 
 # Execute form creation functions for each author
@@ -335,51 +437,45 @@ def main():
     try:
         logger.info("Starting JAMA forms creation process")
         
-        # Clean up existing files
+        # Clean up existing files: the directory only ever holds our
+        # generated docx output, so removing and recreating it wholesale
+        # beats listing and unlinking file by file
         logger.info("Cleaning up existing files")
-        for file in os.listdir(forms_dir):
-            if file.endswith('.docx'):
-                file_path = os.path.join(forms_dir, file)
-                os.remove(file_path)
-                logger.info(f"Removed existing file: {file}")
+        shutil.rmtree(forms_dir, ignore_errors=True)
+        os.makedirs(forms_dir, exist_ok=True)
         
         created_files = []
-        
-        # Create individual forms for each author
-        for author in authors:
-            try:
-                last_name = author['name'].split()[-1]
-                logger.info(f"Creating forms for {last_name}")
-                
-                # Create author contribution form
-                contribution_file = create_author_contribution_form(author)
-                created_files.append(os.path.basename(contribution_file))
-                
-                # Create ICMJE disclosure form
-                disclosure_file = create_icmje_disclosure_form(author)
-                created_files.append(os.path.basename(disclosure_file))
-                
-                logger.info(f"Successfully created forms for {last_name}")
-            except Exception as e:
-                logger.error(f"Error creating forms for {author['name']}: {str(e)}")
-                raise
+
+        # Create individual forms for each author in parallel: each docx
+        # save is an independent, CPU-bound zip compression, so the work
+        # is embarrassingly parallel across authors. spawn keeps the
+        # workers clean since both helpers are top-level functions and
+        # the author dicts pickle fine.
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(authors), os.cpu_count()),
+                mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {}
+            for author in authors:
+                futures[pool.submit(create_author_contribution_form, author)] = author['name']
+                futures[pool.submit(create_icmje_disclosure_form, author)] = author['name']
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    created_files.append(os.path.basename(future.result()))
+                except Exception as e:
+                    logger.error(f"Error creating forms for {futures[future]}: {str(e)}")
+                    raise
+        logger.info(f"Created forms for {len(authors)} authors")
         
         # Create single copyright agreement for all authors
         copyright_file = create_copyright_agreement()
         created_files.append(os.path.basename(copyright_file))
         
         # Verify all expected files were created
-        expected_files = set([
-            f"author_contribution_{author['name'].split()[-1]}.docx" for author in authors
-        ] + [
-            f"icmje_disclosure_{author['name'].split()[-1]}.docx" for author in authors
-        ] + ['copyright_transfer_agreement.docx'])
-        
         actual_files = set(os.listdir(forms_dir))
         
-        if expected_files != actual_files:
-            missing = expected_files - actual_files
-            extra = actual_files - expected_files
+        if _EXPECTED_FILES != actual_files:
+            missing = _EXPECTED_FILES - actual_files
+            extra = actual_files - _EXPECTED_FILES
             error_msg = ""
             if missing:
                 error_msg += f"Missing files: {missing}\n"
@@ -389,7 +485,7 @@ def main():
             raise Exception(f"File verification failed: {error_msg}")
         
         logger.info("Successfully completed JAMA forms creation")
-        logger.info(f"Created {len(expected_files)} files in {forms_dir}")
+        logger.info(f"Created {len(_EXPECTED_FILES)} files in {forms_dir}")
     except Exception as e:
         logger.error(f"Error in JAMA forms creation process: {str(e)}")
         raise
@@ -0,0 +1,8 @@
+# Cython pure-python-mode augmentation for create_jama_supplement.py.
+# Plain CPython ignores this file; it only takes effect when the module
+# is compiled via setup.py (see there). extract_sections is left
+# undeclared because Cython does not support closures in cpdef
+# functions, so it compiles as a regular def either way.
+cimport cython
+
+cpdef str format_code_block(str code_text)
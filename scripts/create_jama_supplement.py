@@ -1,16 +1,84 @@
 #!/usr/bin/env python3
 # Script to create JAMA-formatted supplementary materials
+import functools
 import os
 import re
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml.ns import qn
+
+# Length constants shared across the documents; Pt/Inches re-run
+# the EMU conversion on every call, so convert each value once
+IN_1 = Inches(1)
+IN_11 = Inches(11)
+IN_85 = Inches(8.5)
+IN_HALF = Inches(0.5)
+IN_QUARTER = Inches(0.25)
+PT0 = Pt(0)
+PT12 = Pt(12)
+PT6 = Pt(6)
 
 # Create directories if they don't exist
 manuscript_dir = '../JAMA_submission/manuscript'
 os.makedirs(manuscript_dir, exist_ok=True)
 
-# Function to read the markdown file
+# Compiled once at import so repeated calls skip re's per-call cache lookup
+_RE_CODE_SPLIT = re.compile(r'(```python.*?```)', re.DOTALL)
+_RE_FENCE_PY = re.compile(r'^```python\s*$', re.MULTILINE)
+_RE_FENCE = re.compile(r'^```\s*$', re.MULTILINE)
+
+# Helper to add a paragraph with all formatting applied in one pass,
+# instead of repeating the run/font attribute assignments per paragraph
+def add_styled_paragraph(doc, text, size=None, bold=False, italic=False,
+                         font=None, align=None,
+                         space_before=None, space_after=None,
+                         left_indent=None, line_spacing=None):
+    para = doc.add_paragraph()
+    fmt = para.paragraph_format
+    if align is not None:
+        para.alignment = align
+    if space_before is not None:
+        fmt.space_before = space_before
+    if space_after is not None:
+        fmt.space_after = space_after
+    if left_indent is not None:
+        fmt.left_indent = left_indent
+    if line_spacing is not None:
+        fmt.line_spacing_rule = line_spacing
+    run = para.add_run(text)
+    run_font = run.font
+    # 12pt Times New Roman comes from the Normal style; only write font
+    # attributes for the rare overrides (14pt titles, 10pt code)
+    if size is not None:
+        run_font.size = Pt(size)
+    if font is not None:
+        run_font.name = font
+    if bold:
+        run_font.bold = True
+    if italic:
+        run_font.italic = True
+    return para
+
+# Apply US-letter page size with one-inch margins; every document the
+# script produces uses the same setup
+def _set_letter_margins(doc):
+    section = doc.sections[0]
+    section.page_height = IN_11
+    section.page_width = IN_85
+    section.left_margin = section.right_margin = IN_1
+    section.top_margin = section.bottom_margin = IN_1
+
+# Default font applied once per document so runs inherit it
+def set_default_font(doc):
+    normal = doc.styles['Normal']
+    normal.font.name = 'Times New Roman'
+    normal.font.size = PT12
+    normal.element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
+
+# Function to read the markdown file; cached so producing several
+# outputs from the same source only reads it once
+@functools.lru_cache(maxsize=4)
 def read_markdown_file(file_path):
     with open(file_path, 'r', encoding='utf-8') as file:
         return file.read()
@@ -18,42 +86,97 @@ def read_markdown_file(file_path):
 # Function to convert Python code blocks to formatted text
 def format_code_block(code_text):
     # Remove the triple backticks
-    code_text = re.sub(r'^```python\s*$', '', code_text, flags=re.MULTILINE)
-    code_text = re.sub(r'^```\s*$', '', code_text, flags=re.MULTILINE)
+    code_text = _RE_FENCE_PY.sub('', code_text)
+    code_text = _RE_FENCE.sub('', code_text)
     
     # Clean up any extra whitespace
     return code_text.strip()
 
-# Function to extract sections from the markdown content
+# Function to extract sections from the markdown content in one linear
+# pass over the lines, instead of scanning the whole string once per
+# section with separate regexes. Deterministic per content string, so
+# the result is cached; callers must not mutate it.
+@functools.lru_cache(maxsize=4)
 def extract_sections(content):
     sections = {}
-    
-    # Extract main title
-    title_match = re.search(r'# (.*)', content)
-    if title_match:
-        sections['title'] = title_match.group(1)
-    
-    # Extract detailed data processing section
-    data_processing_match = re.search(r'## Detailed Data Processing and Analysis Methods\s*\n\n(.*?)(?=\n\n## Software)', content, re.DOTALL)
-    if data_processing_match:
-        sections['data_processing'] = data_processing_match.group(1)
-    
-    # Extract software versions section
-    software_match = re.search(r'## Software and Package Versions\s*\n\n(.*?)$', content, re.DOTALL)
-    if software_match:
-        sections['software'] = software_match.group(1)
-    
-    # Extract code blocks
-    code_blocks = re.findall(r'```python\s*(.*?)```', content, re.DOTALL)
+    code_blocks = []
+    subsections = []
+
+    current_h2 = None
+    current_h3 = None
+    h2_lines = []
+    h3_lines = []
+    code_lines = None  # collecting a ```python block when not None
+
+    def flush_h3():
+        nonlocal current_h3
+        if current_h3 is not None:
+            subsections.append((current_h3, '\n'.join(h3_lines).strip()))
+            h3_lines.clear()
+            current_h3 = None
+
+    def flush_h2():
+        nonlocal current_h2
+        flush_h3()
+        if current_h2 is not None:
+            text = '\n'.join(h2_lines).strip()
+            if current_h2 == 'Detailed Data Processing and Analysis Methods':
+                sections['data_processing'] = text
+            elif current_h2 == 'Software and Package Versions':
+                sections['software'] = text
+            h2_lines.clear()
+            current_h2 = None
+
+    for line in content.splitlines():
+        # Inside a code fence, lines are never headings; collect the code
+        # but keep the raw lines in the surrounding section text as well
+        if code_lines is not None:
+            if line.startswith('```'):
+                code_blocks.append('\n'.join(code_lines))
+                code_lines = None
+            else:
+                code_lines.append(line)
+        elif line.startswith('```python'):
+            code_lines = []
+        elif line.startswith('### '):
+            flush_h3()
+            current_h3 = line[4:].strip()
+            if current_h2 is not None:
+                h2_lines.append(line)
+            continue
+        elif line.startswith('## '):
+            flush_h2()
+            current_h2 = line[3:].strip()
+            continue
+        elif line.startswith('# '):
+            sections.setdefault('title', line[2:].strip())
+            continue
+
+        if current_h2 is not None:
+            h2_lines.append(line)
+        if current_h3 is not None:
+            h3_lines.append(line)
+
+    flush_h2()
+
     if code_blocks:
         sections['code_blocks'] = code_blocks
-        
-    # Extract section titles and content
-    section_matches = re.findall(r'### (.*?)\s*\n\n(.*?)(?=\n\n###|\n\n##|\Z)', content, re.DOTALL)
-    sections['subsections'] = section_matches
-    
+    sections['subsections'] = subsections
+
     return sections
 
+# Yield ('text', chunk) / ('code', chunk) pairs in document order
+# without materializing re.split's full parts list
+def _iter_code_and_text(content):
+    pos = 0
+    for match in _RE_CODE_SPLIT.finditer(content):
+        if match.start() > pos:
+            yield 'text', content[pos:match.start()]
+        yield 'code', match.group(0)
+        pos = match.end()
+    if pos < len(content):
+        yield 'text', content[pos:]
+
 # Create JAMA-formatted supplementary materials document
 def create_jama_supplement(source_path, output_path):
     # Read the markdown content
@@ -64,111 +187,70 @@ def create_jama_supplement(source_path, output_path):
     
     # Create a new document
     doc = Document()
+    set_default_font(doc)
     
-    # Set document properties
-    section = doc.sections[0]
-    section.page_height = Inches(11)
-    section.page_width = Inches(8.5)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
+    _set_letter_margins(doc)
     
     # Add title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run("Supplementary Materials")
-    title_run.font.size = Pt(14)
-    title_run.font.bold = True
-    title_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "Supplementary Materials",
+                         size=14, bold=True, align=WD_ALIGN_PARAGRAPH.CENTER)
+
     # Add subtitle
-    subtitle = doc.add_paragraph()
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle_run = subtitle.add_run("Sex Representation Equity in Clinical Trials: A Statistical Analysis")
-    subtitle_run.font.size = Pt(12)
-    subtitle_run.font.italic = True
-    subtitle_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "Sex Representation Equity in Clinical Trials: A Statistical Analysis",
+                         italic=True, align=WD_ALIGN_PARAGRAPH.CENTER)
+
     # Add a page break after the title page
     doc.add_page_break()
-    
+
     # Add the "Detailed Methods" section heading
-    detailed_methods_heading = doc.add_paragraph()
-    detailed_methods_heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    detailed_methods_heading_run = detailed_methods_heading.add_run("DETAILED METHODS")
-    detailed_methods_heading_run.font.size = Pt(12)
-    detailed_methods_heading_run.font.bold = True
-    detailed_methods_heading_run.font.name = 'Times New Roman'
-    
+    add_styled_paragraph(doc, "DETAILED METHODS",
+                         bold=True, align=WD_ALIGN_PARAGRAPH.LEFT)
+
     # Process subsections
     if 'subsections' in sections:
         for title, content in sections['subsections']:
             # Add subsection heading
-            heading = doc.add_paragraph()
-            heading.paragraph_format.space_before = Pt(12)
-            heading.paragraph_format.space_after = Pt(6)
-            heading_run = heading.add_run(title)
-            heading_run.font.bold = True
-            heading_run.font.size = Pt(12)
-            heading_run.font.name = 'Times New Roman'
-            
+            add_styled_paragraph(doc, title, bold=True,
+                                 space_before=PT12, space_after=PT6)
+
             # Check if this section contains code
             if "```python" in content:
-                # Split by code blocks
-                parts = re.split(r'(```python.*?```)', content, flags=re.DOTALL)
-                for part in parts:
-                    if part.strip().startswith("```python"):
-                        # This is a code block
-                        code_text = format_code_block(part)
-                        
-                        # Add the code with a different style
-                        code_para = doc.add_paragraph()
-                        code_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-                        code_para.paragraph_format.space_after = Pt(6)
-                        code_para.paragraph_format.left_indent = Inches(0.5)
-                        code_run = code_para.add_run(code_text)
-                        code_run.font.size = Pt(10)
-                        code_run.font.name = 'Courier New'
-                    else:
+                # Walk the code and text chunks in order
+                for kind, part in _iter_code_and_text(content):
+                    if kind == 'code':
+                        # This is a code block, added with a different style
+                        add_styled_paragraph(doc, format_code_block(part),
+                                             size=10, font='Courier New',
+                                             left_indent=IN_HALF, space_after=PT6,
+                                             line_spacing=WD_LINE_SPACING.SINGLE)
+                    elif part.strip():
                         # This is regular text
-                        if part.strip():
-                            text_para = doc.add_paragraph()
-                            text_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-                            text_para.paragraph_format.space_after = Pt(0)
-                            text_run = text_para.add_run(part.strip())
-                            text_run.font.size = Pt(12)
-                            text_run.font.name = 'Times New Roman'
+                        add_styled_paragraph(doc, part.strip(),
+                                             space_after=PT0,
+                                             line_spacing=WD_LINE_SPACING.DOUBLE)
             else:
                 # Regular text section
-                text_para = doc.add_paragraph()
-                text_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-                text_para.paragraph_format.space_after = Pt(0)
-                text_run = text_para.add_run(content.strip())
-                text_run.font.size = Pt(12)
-                text_run.font.name = 'Times New Roman'
-    
+                add_styled_paragraph(doc, content.strip(),
+                                     space_after=PT0,
+                                     line_spacing=WD_LINE_SPACING.DOUBLE)
+
     # Add software versions section
     if 'software' in sections:
-        software_heading = doc.add_paragraph()
-        software_heading.paragraph_format.space_before = Pt(12)
-        software_heading.paragraph_format.space_after = Pt(6)
-        software_heading_run = software_heading.add_run("Software and Package Versions")
-        software_heading_run.font.bold = True
-        software_heading_run.font.size = Pt(12)
-        software_heading_run.font.name = 'Times New Roman'
-        
-        # Create a formatted list
-        lines = sections['software'].strip().split('\n')
-        for line in lines:
-            if line.strip():
-                item_para = doc.add_paragraph()
-                item_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-                item_para.paragraph_format.left_indent = Inches(0.25)
-                item_para.paragraph_format.space_after = Pt(0)
-                item_run = item_para.add_run(line.strip())
-                item_run.font.size = Pt(12)
-                item_run.font.name = 'Times New Roman'
+        add_styled_paragraph(doc, "Software and Package Versions",
+                             bold=True, space_before=PT12, space_after=PT6)
+
+        # Write the whole list as one paragraph with line breaks between
+        # entries — one paragraph and one run instead of a full
+        # paragraph/run/format block per package line
+        items = [line.strip() for line in sections['software'].splitlines() if line.strip()]
+        if items:
+            para = add_styled_paragraph(doc, items[0],
+                                        left_indent=IN_QUARTER, space_after=PT0,
+                                        line_spacing=WD_LINE_SPACING.DOUBLE)
+            run = para.runs[0]
+            for item in items[1:]:
+                run.add_break()
+                run.add_text(item)
     
     # Save the document
     doc.save(output_path)
@@ -2,55 +2,94 @@
 # Script to create JAMA-formatted tables
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import RGBColor
-from docx.enum.table import WD_TABLE_ALIGNMENT, WD_CELL_VERTICAL_ALIGNMENT
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 
 # Create directories if they don't exist
 tables_dir = '../JAMA_submission/tables'
 os.makedirs(tables_dir, exist_ok=True)
 
-# Function to read a markdown file
-def read_markdown_file(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return file.read()
+# Compiled once at import; the separator and numeric checks run per
+# line/cell inside the parsing loops
+_TITLE_RE = re.compile(r'\*\*Table \d+: (.*?)\*\*')
+_FOOTNOTE_RE = re.compile(r'Note: (.*?)$', re.MULTILINE)
+_SEPARATOR_RE = re.compile(r'^\s*\|[-\s|]+\|\s*$')
+_NUMERIC_RE = re.compile(r'^-?\d{1,3}(,\d{3})*(\.\d+)?%?$')
 
-# Function to parse markdown table into rows and columns
-def parse_markdown_table(markdown_content):
-    # Extract title
-    title_match = re.search(r'\*\*Table \d+: (.*?)\*\*', markdown_content)
-    title = title_match.group(1) if title_match else "Table"
-    
-    # Extract footnote
-    footnote_match = re.search(r'Note: (.*?)$', markdown_content, re.MULTILINE)
-    footnote = footnote_match.group(1) if footnote_match else ""
-    
-    # Extract table content
-    lines = markdown_content.strip().split('\n')
+# The table is assembled as one XML string and parsed in a single pass,
+# instead of driving thousands of python-docx attribute setters cell by
+# cell. Borders come from the built-in Table Grid style; the header
+# cells reference the JAMAHeader character style defined per document.
+_TABLE_XML = (
+    f'<w:tbl {nsdecls("w")}>'
+    '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/>'
+    '<w:jc w:val="center"/></w:tblPr>'
+    '<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+)
+_HEADER_CELL_XML = (
+    '<w:tc><w:tcPr><w:vAlign w:val="center"/></w:tcPr>'
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr><w:rStyle w:val="JAMAHeader"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>'
+)
+_BODY_CELL_XML = (
+    '<w:tc><w:tcPr><w:vAlign w:val="center"/></w:tcPr>'
+    '<w:p><w:pPr><w:jc w:val="{align}"/></w:pPr>'
+    '<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p></w:tc>'
+)
+_EMPTY_CELL_XML = '<w:tc><w:p/></w:tc>'
+
+# Split a table row into cleaned cells in one pass: the generator feeds
+# the filtering list-comp directly, so no intermediate list of parts is
+# built, and the default-argument aliases skip the per-cell method
+# lookups on str
+def _parse_row(line, _replace=str.replace, _strip=str.strip):
+    return [cell for cell in
+            (_strip(_replace(part, '**', '')) for part in line.split('|'))
+            if cell]
+
+# Function to parse a markdown table file into title, footnote and rows
+# in one streaming pass over the lines, without holding the whole file
+# (and a split copy of it) in memory
+def parse_markdown_file(file_path):
+    title = None
+    footnote = ""
     rows = []
-    
-    # Find lines that contain table rows (those with pipes)
-    for line in lines:
-        if '|' in line and not line.startswith('Note:'):
-            # Skip separator rows (those with dashes)
-            if re.match(r'^\s*\|[-\s|]+\|\s*$', line):
-                continue
-                
-            # Extract cells from the row
-            cells = []
-            for cell in line.split('|'):
-                if cell.strip():  # Skip empty cells at the beginning/end
-                    # Clean up cell content - remove markdown formatting
-                    clean_cell = re.sub(r'\*\*(.*?)\*\*', r'\1', cell.strip())
-                    cells.append(clean_cell)
-            
-            if cells:  # Add only non-empty rows
-                rows.append(cells)
-    
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.startswith('Note:'):
+                if not footnote:
+                    footnote_match = _FOOTNOTE_RE.match(line)
+                    if footnote_match:
+                        footnote = footnote_match.group(1).strip()
+            # The cheap pipe scan rules out most non-table lines before
+            # any regex runs
+            elif '|' in line:
+                # Skip separator rows (those with dashes)
+                if _SEPARATOR_RE.match(line):
+                    continue
+
+                # Extract cells from the row, dropping the empty edge
+                # cells the leading/trailing pipes leave
+                cells = _parse_row(line)
+
+                if cells:  # Add only non-empty rows
+                    rows.append(cells)
+            elif title is None:
+                title_match = _TITLE_RE.search(line)
+                if title_match:
+                    title = title_match.group(1)
+
     return {
-        'title': title,
+        'title': title if title is not None else "Table",
         'footnote': footnote,
         'rows': rows
     }
@@ -58,7 +97,21 @@ def parse_markdown_table(markdown_content):
 # Function to create a JAMA-formatted table document
 def create_jama_table_document(table_data, table_number):
     doc = Document()
-    
+
+    # 12pt Times New Roman comes from the Normal style, written once per
+    # document; every run inherits it, so the only per-run formatting
+    # left is the bold header style and the footnote overrides
+    normal = doc.styles['Normal']
+    normal.font.name = 'Times New Roman'
+    normal.font.size = Pt(12)
+    normal.element.rPr.rFonts.set(qn('w:eastAsia'), 'Times New Roman')
+
+    header_style = doc.styles.add_style('JAMAHeader', WD_STYLE_TYPE.CHARACTER)
+    header_style.font.bold = True
+
+    align_center = WD_ALIGN_PARAGRAPH.CENTER
+    align_left = WD_ALIGN_PARAGRAPH.LEFT
+
     # Set document properties
     section = doc.sections[0]
     section.page_height = Inches(11)
@@ -70,77 +123,73 @@ def create_jama_table_document(table_data, table_number):
     
     # Add title
     title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title.add_run(f"Table {table_number}. {table_data['title']}")
-    title_run.font.size = Pt(12)
-    title_run.font.bold = True
-    title_run.font.name = 'Times New Roman'
+    title.alignment = align_center
+    title.add_run(f"Table {table_number}. {table_data['title']}", style=header_style)
     
     # Create table
-    num_rows = len(table_data['rows'])
-    if num_rows > 0:
-        num_cols = len(table_data['rows'][0])
-        table = doc.add_table(rows=num_rows, cols=num_cols)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # Fill in table cells
-        for i, row in enumerate(table_data['rows']):
-            for j, cell_text in enumerate(row):
-                if j < num_cols:  # Ensure we don't exceed column count
-                    cell = table.cell(i, j)
-                    cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
-                    
-                    # Set cell properties
-                    paragraph = cell.paragraphs[0]
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    
-                    # For header row, make text bold
-                    if i == 0:
-                        run = paragraph.add_run(cell_text)
-                        run.font.bold = True
-                        run.font.size = Pt(12)
-                        run.font.name = 'Times New Roman'
-                        
-                        # Add light gray background to header cells
-                        # Note: python-docx doesn't directly support cell background colors
-                        # This would typically be set through table styles in a real implementation
-                    else:
-                        # For numeric cells, right-align
-                        if re.match(r'^-?\d+(\.\d+)?%?$', cell_text.strip()) or cell_text.strip() in ['p', 'P']:
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                        # For the first column (disease categories), left-align
-                        elif j == 0:
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                        
-                        run = paragraph.add_run(cell_text)
-                        run.font.size = Pt(12)
-                        run.font.name = 'Times New Roman'
+    rows = table_data['rows']
+    if rows:
+        num_cols = len(rows[0])
+
+        # Alignment is really a property of the column, not the cell:
+        # classify each column once against the numeric pattern instead
+        # of re-running the regex on every cell in the fill loop
+        def _is_numeric(cell_text):
+            text = cell_text.strip()
+            return bool(_NUMERIC_RE.match(text)) or text in ('p', 'P')
+
+        col_align = [
+            'left' if j == 0
+            else 'right' if all(_is_numeric(row[j]) for row in rows[1:] if j < len(row))
+            else 'center'
+            for j in range(num_cols)
+        ]
+
+        # Render every row through the XML templates and parse the
+        # finished table in one go; short rows are padded with empty
+        # cells so the grid stays rectangular
+        def _row_xml(cells):
+            return '<w:tr>%s%s</w:tr>' % (
+                ''.join(cells), _EMPTY_CELL_XML * (num_cols - len(cells)))
+
+        header_row = _row_xml(
+            [_HEADER_CELL_XML.format(text=escape(cell_text))
+             for cell_text in rows[0][:num_cols]])
+        body_rows = ''.join(
+            _row_xml(
+                [_BODY_CELL_XML.format(align=col_align[j], text=escape(cell_text))
+                 for j, cell_text in enumerate(row[:num_cols])])
+            for row in rows[1:])
+        table = parse_xml(_TABLE_XML.format(grid='<w:gridCol/>' * num_cols,
+                                            rows=header_row + body_rows))
+        doc.element.body.xpath('./w:sectPr')[0].addprevious(table)
     
     # Add footnote
     if table_data['footnote']:
         footnote = doc.add_paragraph()
-        footnote.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        footnote.alignment = align_left
         footnote_run = footnote.add_run(f"Note: {table_data['footnote']}")
         footnote_run.font.size = Pt(10)
         footnote_run.font.italic = True
-        footnote_run.font.name = 'Times New Roman'
     
     return doc
 
-# Process Table 1
-table1_content = read_markdown_file('../tables/table1.md')
-table1_data = parse_markdown_table(table1_content)
-table1_doc = create_jama_table_document(table1_data, 1)
-table1_path = os.path.join(tables_dir, 'table1.docx')
-table1_doc.save(table1_path)
-print(f"Table 1 created and saved to {table1_path}")
-
-# Process Table 2
-table2_content = read_markdown_file('../tables/table2.md')
-table2_data = parse_markdown_table(table2_content)
-table2_doc = create_jama_table_document(table2_data, 2)
-table2_path = os.path.join(tables_dir, 'table2.docx')
-table2_doc.save(table2_path)
-print(f"Table 2 created and saved to {table2_path}")
+# Parse, build and save one table end to end; each table is independent
+# so the workers below can run them concurrently
+def build_table(table_number, source_path):
+    table_data = parse_markdown_file(source_path)
+    doc = create_jama_table_document(table_data, table_number)
+    output_path = os.path.join(tables_dir, f'table{table_number}.docx')
+    doc.save(output_path)
+    print(f"Table {table_number} created and saved to {output_path}")
+
+table_numbers = [1, 2]
+table_sources = ['../tables/table1.md', '../tables/table2.md']
+
+if __name__ == '__main__':
+    # Each table's parse + lxml serialization is independent, so build
+    # them in worker processes; the guard keeps workers that re-import
+    # this module from recursing into the pool
+    with ProcessPoolExecutor(max_workers=len(table_sources)) as executor:
+        list(executor.map(build_table, table_numbers, table_sources))
 
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 # Script to process figures according to JAMA requirements
 import os
-from PIL import Image
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Check if PIL is installed
 try:
@@ -35,6 +35,16 @@ required_dpi = 300
 def process_figure(source_path, target_path):
     """Process a figure to meet JAMA requirements"""
     try:
+        # generate_figures.py writes the TIFFs directly now; when the
+        # target is current and already tagged at the required DPI the
+        # conversion below is redundant and we only verify it
+        if (os.path.exists(target_path)
+                and os.path.getmtime(target_path) >= os.path.getmtime(source_path)):
+            with Image.open(target_path) as existing:
+                if round(existing.info.get('dpi', (0, 0))[0]) >= required_dpi:
+                    print(f"Verified {target_path} - already at {required_dpi} DPI")
+                    return True
+
         # Open the image
         img = Image.open(source_path)
         
@@ -42,27 +52,38 @@ def process_figure(source_path, target_path):
         width, height = img.size
         print(f"Processing {source_path} - Original size: {width}x{height}")
         
-        # Calculate appropriate dimensions for 300 DPI
-        # Assuming original image is 72 DPI (standard screen resolution)
-        original_dpi = 72  # Standard screen resolution
-        
-        # Calculate new dimensions to maintain equivalent size at 300 DPI
-        new_width = width * required_dpi // original_dpi
-        new_height = height * required_dpi // original_dpi
-        
-        # Resize the image
-        resized_img = img.resize((new_width, new_height), Image.LANCZOS)
+        # generate_figures.py already saves these PNGs at 300 DPI, so
+        # the common case needs no resampling at all — just the DPI tag
+        # on the TIFF. Only genuinely low-resolution sources (no DPI
+        # metadata means assume 72) get the LANCZOS upsample.
+        src_dpi = round(img.info.get('dpi', (72, 72))[0])
+        if src_dpi >= required_dpi:
+            new_width, new_height = width, height
+            resized_img = img
+        else:
+            new_width = width * required_dpi // src_dpi
+            new_height = height * required_dpi // src_dpi
+            # For an exact integer upsample of an already-rasterized
+            # figure, BOX is plain pixel replication: much cheaper than
+            # LANCZOS and an acceptable trade-off since the target DPI
+            # only needs the pixel count, not new detail. LANCZOS stays
+            # for fractional ratios
+            ratio = required_dpi / src_dpi
+            resample = (Image.Resampling.BOX if ratio.is_integer()
+                        else Image.Resampling.LANCZOS)
+            resized_img = img.resize((new_width, new_height), resample)
         
         # Convert to RGB if it's not already (TIFF supports various color modes)
         if resized_img.mode != 'RGB':
             resized_img = resized_img.convert('RGB')
         
-        # Save as TIFF with high quality and 300 DPI
+        # Save as TIFF with high quality and 300 DPI. Deflate is
+        # lossless like LZW but encodes much faster and usually smaller
         resized_img.save(
             target_path,
             format='TIFF',
             dpi=(required_dpi, required_dpi),
-            compression='lzw'  # LZW compression maintains quality
+            compression='tiff_adobe_deflate'
         )
         
         print(f"Saved {target_path} - New size: {new_width}x{new_height} at {required_dpi} DPI")
@@ -76,11 +97,11 @@ def main():
     """Main function to process all figures"""
     print("Processing figures for JAMA submission...")
     
-    success_count = 0
-    for i, (source, target) in enumerate(zip(source_figures, target_figures)):
-        print(f"\nProcessing Figure {i+1}:")
-        if process_figure(source, target):
-            success_count += 1
+    # Each figure conversion is independent and dominated by Pillow's
+    # resize and Deflate encode, so run them in worker processes
+    with ProcessPoolExecutor(max_workers=min(len(source_figures), os.cpu_count())) as executor:
+        results = list(executor.map(process_figure, source_figures, target_figures))
+    success_count = sum(results)
     
     print(f"\nProcessing complete. Successfully processed {success_count} of {len(source_figures)} figures.")
 
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# Optional build: compile the supplement markdown parsing with Cython.
+# The scripts run unchanged as pure Python when no compiled extension is
+# present, so this is never required — it only speeds up repeat runs.
+#
+#   pip install cython
+#   python setup.py build_ext --inplace
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize('create_jama_supplement.py', language_level=3),
+)
@@ -1,7 +1,13 @@
+import os
+
 import pandas as pd
 import numpy as np
 import requests
-import time
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+# Pin the file-rendering backend before pyplot loads so matplotlib
+# never probes for a GUI toolkit
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.model_selection import train_test_split
@@ -10,7 +16,14 @@ from sklearn.metrics import classification_report, confusion_matrix
 import re
 import statsmodels.api as sm
 import statsmodels.formula.api as smf
-from scipy.stats import chi2_contingency
+from scipy.stats import chi2 as chi2_dist, chi2_contingency
+
+# orjson decodes the API responses several times faster than the stdlib
+# parser; fall back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set plotting style
 sns.set(font_scale=1.2)
@@ -21,8 +34,39 @@ sns.set_style("whitegrid")
 # --------------------------
 
 print("Loading and cleaning data...")
+
+# Only these columns feed the cleaning and analysis below; parsing the
+# rest of the merged export would be wasted time and memory
+_ANALYSIS_COLUMNS = ['NCT Number_trial', 'Sex', 'Phases', 'Country',
+                     'Gender Inequality Index', 'Conditions']
+
+# Rows parsed per chunk on the pandas fallback path; bounds the
+# parser's working set if the merged export grows to millions of rows
+_CSV_CHUNK_ROWS = 200_000
+
+def load_merged_indicators(path):
+    """Read the merged-indicators CSV restricted to the analysis
+    columns, preferring pyarrow's multithreaded parser; falls back to
+    pandas' C engine reading in bounded chunks when pyarrow is
+    unavailable. Free-text fields can contain newlines inside quotes,
+    and empty strings must stay null to match the C engine's output."""
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        chunks = pd.read_csv(path, usecols=_ANALYSIS_COLUMNS,
+                             chunksize=_CSV_CHUNK_ROWS)
+        return pd.concat(chunks, ignore_index=True)
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=_ANALYSIS_COLUMNS,
+            strings_can_be_null=True),
+    )
+    return table.to_pandas()
+
 # Load your dataset
-df = pd.read_csv("merged_clinical_indicators_2025-05-01.csv")
+df = load_merged_indicators("merged_clinical_indicators_2025-05-01.csv")
 
 # Check for duplicate entries
 print(f"Original row count: {df.shape[0]}")
@@ -49,31 +93,33 @@ def clean_data(df):
     if 'Gender Inequality Index' in clean_df.columns:
         clean_df['Gender Inequality Index'] = pd.to_numeric(clean_df['Gender Inequality Index'], errors='coerce')
     
-    # For phases, standardize format
+    # For phases, standardize format (Phase 1, Phase I, etc.)
     if 'Phases' in clean_df.columns:
-        # Extract phase number if present (Phase 1, Phase I, etc.)
-        def standardize_phase(phase_text):
-            if pd.isna(phase_text) or phase_text == 'Unknown':
-                return 'Unknown'
-            
-            phase_text = str(phase_text).upper()
-            if 'PHASE 1' in phase_text or 'PHASE I' in phase_text:
-                return 'Phase 1'
-            elif 'PHASE 2' in phase_text or 'PHASE II' in phase_text:
-                return 'Phase 2'
-            elif 'PHASE 3' in phase_text or 'PHASE III' in phase_text:
-                return 'Phase 3'
-            elif 'PHASE 4' in phase_text or 'PHASE IV' in phase_text:
-                return 'Phase 4'
-            elif 'EARLY' in phase_text:
-                return 'Early Phase'
-            elif 'NOT APPLICABLE' in phase_text:
-                return 'Not Applicable'
-            else:
-                return 'Other'
-        
-        clean_df['Standardized_Phase'] = clean_df['Phases'].apply(standardize_phase)
-    
+        # One vectorized contains-scan per phase instead of a Python
+        # function dispatched per row; np.select keeps the first-match
+        # priority of the old if/elif chain
+        phases = clean_df['Phases']
+        phases_upper = phases.astype(str).str.upper()
+        clean_df['Standardized_Phase'] = pd.Categorical(np.select(
+            [
+                phases.isna() | phases.eq('Unknown'),
+                phases_upper.str.contains('PHASE 1|PHASE I', regex=True),
+                phases_upper.str.contains('PHASE 2|PHASE II', regex=True),
+                phases_upper.str.contains('PHASE 3|PHASE III', regex=True),
+                phases_upper.str.contains('PHASE 4|PHASE IV', regex=True),
+                phases_upper.str.contains('EARLY', regex=False),
+                phases_upper.str.contains('NOT APPLICABLE', regex=False),
+            ],
+            ['Unknown', 'Phase 1', 'Phase 2', 'Phase 3', 'Phase 4',
+             'Early Phase', 'Not Applicable'],
+            default='Other'))
+
+    # Country has few distinct values, so dictionary-encode it: the
+    # downstream value_counts/crosstab/groupby calls then work on
+    # integer codes instead of re-hashing the same strings
+    if 'Country' in clean_df.columns:
+        clean_df['Country'] = clean_df['Country'].astype('category')
+
     return clean_df
 
 # Apply cleaning function
@@ -84,55 +130,58 @@ df_clean = clean_data(df)
 # -------------------------------
 
 print("Categorizing trials by sex representation...")
-def categorize_by_sex(sex_value):
-    if pd.isna(sex_value) or sex_value == 'Unknown':
-        return 'Unknown'
-    
-    sex_value = str(sex_value).upper()
-    if sex_value == 'FEMALE' or sex_value == 'F':
-        return 'Female Only'
-    elif sex_value == 'MALE' or sex_value == 'M':
-        return 'Male Only'
-    elif 'FEMALE' in sex_value and 'MALE' in sex_value:
-        return 'Both Sexes'
-    elif 'ALL' in sex_value:
-        return 'Both Sexes'
-    else:
-        return 'Unknown'
-
-df_clean['Sex_Category'] = df_clean['Sex'].apply(categorize_by_sex)
+# Uppercase once and classify the whole column with boolean masks;
+# np.select keeps the first-match priority of the old per-row chain
+sex = df_clean['Sex']
+sex_upper = sex.astype(str).str.upper()
+# The Categorical wrapper dictionary-encodes the column; inferring the
+# vocabulary from the observed values keeps value_counts and crosstab
+# output free of all-zero categories, exactly as with object strings
+df_clean['Sex_Category'] = pd.Categorical(np.select(
+    [
+        sex.isna() | sex.eq('Unknown'),
+        sex_upper.isin(['FEMALE', 'F']),
+        sex_upper.isin(['MALE', 'M']),
+        sex_upper.str.contains('FEMALE', regex=False)
+        & sex_upper.str.contains('MALE', regex=False),
+        sex_upper.str.contains('ALL', regex=False),
+    ],
+    ['Unknown', 'Female Only', 'Male Only', 'Both Sexes', 'Both Sexes'],
+    default='Unknown'))
 
 # ----------------------------
 # DISEASE TYPE CATEGORIZATION
 # ----------------------------
 
 print("Categorizing trials by disease type...")
-def categorize_disease(conditions):
-    if pd.isna(conditions):
-        return 'Unknown'
-    
-    conditions = str(conditions).upper()
-    
-    # Define categories with associated keywords
-    disease_categories = {
-        'COVID-19': ['COVID', 'SARS-COV-2', 'CORONAVIRUS', 'CORONA VIRUS'],
-        'HIV/AIDS': ['HIV', 'AIDS', 'HUMAN IMMUNODEFICIENCY VIRUS'],
-        'Cancer': ['CANCER', 'TUMOR', 'NEOPLASM', 'CARCINOMA', 'LEUKEMIA', 'LYMPHOMA', 'ONCOLOGY'],
-        'Cardiovascular': ['HEART', 'CARDIAC', 'CARDIOVASCULAR', 'STROKE', 'HYPERTENSION'],
-        'Diabetes': ['DIABETES', 'DIABETIC'],
-        'Mental Health': ['PSYCHIATRIC', 'DEPRESSION', 'ANXIETY', 'SCHIZOPHRENIA', 'BIPOLAR', 'MENTAL'],
-        'Respiratory': ['ASTHMA', 'COPD', 'LUNG', 'PULMONARY', 'RESPIRATORY'],
-        'Infectious Disease': ['INFECTION', 'INFECTIOUS', 'BACTERIAL', 'VIRAL', 'FUNGAL', 'MALARIA', 'TUBERCULOSIS']
-    }
-    
-    # Check if conditions contain any keywords for each category
-    for category, keywords in disease_categories.items():
-        if any(keyword in conditions for keyword in keywords):
-            return category
-    
-    return 'Other'
+# Categories with associated keywords, checked in priority order; each
+# keyword list is compiled into one alternation pattern so categorizing
+# is a single C-level regex scan per category instead of nested Python
+# substring checks per row
+disease_categories = {
+    'COVID-19': ['COVID', 'SARS-COV-2', 'CORONAVIRUS', 'CORONA VIRUS'],
+    'HIV/AIDS': ['HIV', 'AIDS', 'HUMAN IMMUNODEFICIENCY VIRUS'],
+    'Cancer': ['CANCER', 'TUMOR', 'NEOPLASM', 'CARCINOMA', 'LEUKEMIA', 'LYMPHOMA', 'ONCOLOGY'],
+    'Cardiovascular': ['HEART', 'CARDIAC', 'CARDIOVASCULAR', 'STROKE', 'HYPERTENSION'],
+    'Diabetes': ['DIABETES', 'DIABETIC'],
+    'Mental Health': ['PSYCHIATRIC', 'DEPRESSION', 'ANXIETY', 'SCHIZOPHRENIA', 'BIPOLAR', 'MENTAL'],
+    'Respiratory': ['ASTHMA', 'COPD', 'LUNG', 'PULMONARY', 'RESPIRATORY'],
+    'Infectious Disease': ['INFECTION', 'INFECTIOUS', 'BACTERIAL', 'VIRAL', 'FUNGAL', 'MALARIA', 'TUBERCULOSIS']
+}
+# Compiled once at import; str.contains accepts the compiled pattern
+# directly, so repeated categorization passes skip re-compilation
+_DISEASE_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in disease_categories.items())
 
-df_clean['Disease_Category'] = df_clean['Conditions'].apply(categorize_disease)
+conditions = df_clean['Conditions']
+conditions_upper = conditions.astype(str).str.upper()
+df_clean['Disease_Category'] = pd.Categorical(np.select(
+    [conditions.isna()]
+    + [conditions_upper.str.contains(pattern)
+       for _, pattern in _DISEASE_PATTERNS],
+    ['Unknown'] + [category for category, _ in _DISEASE_PATTERNS],
+    default='Other'))
 
 # ------------------------
 # GII CATEGORIZATION
@@ -147,34 +196,65 @@ if 'Gender Inequality Index' in df_clean.columns:
     # Create quantile-based categories
     low_threshold = gii_data.quantile(0.33)
     high_threshold = gii_data.quantile(0.67)
-    
-    def categorize_gii(gii_value):
-        if pd.isna(gii_value):
-            return 'Unknown'
-        elif gii_value <= low_threshold:
-            return 'Low GII'
-        elif gii_value <= high_threshold:
-            return 'Medium GII'
-        else:
-            return 'High GII'
-    
-    df_clean['GII_Category'] = df_clean['Gender Inequality Index'].apply(categorize_gii)
+
+    # pd.cut bins the whole float column in C with the same
+    # right-inclusive edges as the old per-row comparisons and returns
+    # a Categorical directly; NaN keeps mapping to 'Unknown'
+    gii_bins = [-np.inf, low_threshold, high_threshold, np.inf]
+    gii_labels = ['Low GII', 'Medium GII', 'High GII']
+    if low_threshold == high_threshold:
+        # Skewed GII distributions can land both tertile cuts on the
+        # same value; the <= chain then never assigned 'Medium GII', so
+        # drop the duplicate edge and its label to keep pd.cut's bin
+        # edges unique
+        del gii_bins[2]
+        del gii_labels[1]
+    df_clean['GII_Category'] = (
+        pd.cut(df_clean['Gender Inequality Index'],
+               bins=gii_bins, labels=gii_labels)
+        .cat.add_categories('Unknown')
+        .fillna('Unknown')
+        .cat.remove_unused_categories())
 
 # ----------------------------------
 # DEFINE FUNCTION TO FETCH ELIGIBILITY
 # ----------------------------------
 
+# Eligibility text per NCT id is immutable for our purposes, so cache
+# each response on disk: re-runs read the text back instead of
+# re-downloading the same trials every time
+_ELIGIBILITY_CACHE_DIR = 'eligibility_cache'
+
 def fetch_eligibility(nct_id):
+    cache_path = os.path.join(_ELIGIBILITY_CACHE_DIR, f"{nct_id}.txt")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        pass
+
     url = f"https://clinicaltrials.gov/api/query/full_studies?expr={nct_id}&min_rnk=1&max_rnk=1&fmt=json"
     try:
         response = requests.get(url)
-        data = response.json()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
         eligibility = data["FullStudiesResponse"]["FullStudies"][0]["Study"]["ProtocolSection"]["EligibilityModule"].get("EligibilityCriteria", "")
-        return eligibility
     except Exception as e:
         print(f"Error fetching data for {nct_id}: {e}")
         return ""
 
+    # Only successful responses are cached, so transient failures get
+    # retried on the next run
+    try:
+        os.makedirs(_ELIGIBILITY_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(eligibility)
+    except OSError:
+        pass
+    return eligibility
+
 # ----------------------------------------
 # EXPLORATORY ANALYSIS AND VISUALIZATION
 # ----------------------------------------
@@ -189,17 +269,22 @@ def run_exploratory_analysis(df):
     
     # Store detailed statistics for manuscript
     detailed_stats = {}
-    
+
+    # Counted once and reused by the bar plot, the detailed stats and
+    # the summary table at the bottom
+    sex_counts = df['Sex_Category'].value_counts()
+
     try:
-        # 1. Overall distribution of sex categories
-        plt.figure(figsize=(10, 6))
-        sex_counts = df['Sex_Category'].value_counts()
-        sex_counts.plot(kind='bar', color='skyblue')
-        plt.title('Distribution of Trials by Sex Category')
-        plt.ylabel('Number of Trials')
-        plt.xlabel('Sex Category')
-        plt.tight_layout()
-        plt.savefig('figures/sex_distribution.png')
+        # 1. Overall distribution of sex categories. Constrained layout
+        # at figure creation replaces the costlier tight_layout solver,
+        # and each figure is closed after saving so memory stays flat
+        fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+        sex_counts.plot(kind='bar', color='skyblue', ax=ax)
+        ax.set_title('Distribution of Trials by Sex Category')
+        ax.set_ylabel('Number of Trials')
+        ax.set_xlabel('Sex Category')
+        fig.savefig('figures/sex_distribution.png')
+        plt.close(fig)
         
         # Save detailed sex category distribution
         detailed_stats['sex_distribution'] = sex_counts.to_dict()
@@ -214,40 +299,45 @@ def run_exploratory_analysis(df):
     
     try:
         # 2. Distribution of sex categories by disease type
-        plt.figure(figsize=(14, 8))
-        sex_disease = pd.crosstab(df['Disease_Category'], df['Sex_Category'])
+        # groupby size + unstack computes the same contingency table as
+        # pd.crosstab with less per-row overhead, dispatching to the
+        # integer-code path on the categorical columns
+        sex_disease = (df.groupby(['Disease_Category', 'Sex_Category'], observed=False)
+                         .size()
+                         .unstack('Sex_Category', fill_value=0))
         sex_disease_pct = sex_disease.div(sex_disease.sum(axis=1), axis=0) * 100
-        sex_disease_pct.plot(kind='bar', stacked=True, colormap='viridis')
-        plt.title('Distribution of Sex Categories by Disease Type')
-        plt.ylabel('Percentage of Trials')
-        plt.xlabel('Disease Category')
-        plt.legend(title='Sex Category')
-        plt.tight_layout()
-        plt.savefig('figures/sex_by_disease.png')
+        fig, ax = plt.subplots(figsize=(14, 8), layout='constrained')
+        sex_disease_pct.plot(kind='bar', stacked=True, colormap='viridis', ax=ax)
+        ax.set_title('Distribution of Sex Categories by Disease Type')
+        ax.set_ylabel('Percentage of Trials')
+        ax.set_xlabel('Disease Category')
+        ax.legend(title='Sex Category')
+        fig.savefig('figures/sex_by_disease.png')
+        plt.close(fig)
         
-        # Save detailed disease-sex cross-tabulation
+        # Save detailed disease-sex cross-tabulation; round once and
+        # reuse for both the stored dict and the printout
+        sex_disease_pct_rounded = sex_disease_pct.round(1)
         detailed_stats['disease_sex_counts'] = sex_disease.to_dict()
-        detailed_stats['disease_sex_percentages'] = sex_disease_pct.round(1).to_dict()
-        
+        detailed_stats['disease_sex_percentages'] = sex_disease_pct_rounded.to_dict()
+
         print("\n--- Disease Type by Sex Category (counts) ---")
         print(sex_disease)
-        
+
         print("\n--- Disease Type by Sex Category (percentages) ---")
-        print(sex_disease_pct.round(1))
-        
-        # Calculate female inclusion rate by disease
-        female_inclusion_by_disease = {}
-        for disease in sex_disease.index:
-            total_trials = sex_disease.loc[disease].sum()
-            female_trials = 0
-            if 'Female Only' in sex_disease.columns:
-                female_trials += sex_disease.loc[disease, 'Female Only']
-            if 'Both Sexes' in sex_disease.columns:
-                female_trials += sex_disease.loc[disease, 'Both Sexes']
-            
-            rate = (female_trials / total_trials * 100).round(1) if total_trials > 0 else 0
-            female_inclusion_by_disease[disease] = rate
+        print(sex_disease_pct_rounded)
         
+        # Calculate female inclusion rate by disease with column sums on
+        # the contingency table instead of per-row .loc lookups
+        disease_totals = sex_disease.sum(axis=1)
+        female_trials = (sex_disease
+                         .reindex(columns=['Female Only', 'Both Sexes'], fill_value=0)
+                         .sum(axis=1))
+        female_inclusion_by_disease = ((female_trials / disease_totals * 100)
+                                       .round(1)
+                                       .where(disease_totals > 0, 0)
+                                       .to_dict())
+
         detailed_stats['female_inclusion_by_disease'] = female_inclusion_by_disease
         
         print("\n--- Female Inclusion Rate by Disease (%) ---")
@@ -259,40 +349,41 @@ def run_exploratory_analysis(df):
     try:
         # 3. Distribution of sex categories by trial phase
         if 'Standardized_Phase' in df.columns:
-            plt.figure(figsize=(12, 7))
-            phase_sex = pd.crosstab(df['Standardized_Phase'], df['Sex_Category'])
+            phase_sex = (df.groupby(['Standardized_Phase', 'Sex_Category'], observed=False)
+                           .size()
+                           .unstack('Sex_Category', fill_value=0))
             phase_sex_pct = phase_sex.div(phase_sex.sum(axis=1), axis=0) * 100
-            phase_sex_pct.plot(kind='bar', stacked=True, colormap='plasma')
-            plt.title('Distribution of Sex Categories by Trial Phase')
-            plt.ylabel('Percentage of Trials')
-            plt.xlabel('Trial Phase')
-            plt.legend(title='Sex Category')
-            plt.tight_layout()
-            plt.savefig('figures/sex_by_phase.png')
+            fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+            phase_sex_pct.plot(kind='bar', stacked=True, colormap='plasma', ax=ax)
+            ax.set_title('Distribution of Sex Categories by Trial Phase')
+            ax.set_ylabel('Percentage of Trials')
+            ax.set_xlabel('Trial Phase')
+            ax.legend(title='Sex Category')
+            fig.savefig('figures/sex_by_phase.png')
+            plt.close(fig)
             
             # Save detailed phase-sex cross-tabulation
+            phase_sex_pct_rounded = phase_sex_pct.round(1)
             detailed_stats['phase_sex_counts'] = phase_sex.to_dict()
-            detailed_stats['phase_sex_percentages'] = phase_sex_pct.round(1).to_dict()
-            
+            detailed_stats['phase_sex_percentages'] = phase_sex_pct_rounded.to_dict()
+
             print("\n--- Trial Phase by Sex Category (counts) ---")
             print(phase_sex)
-            
+
             print("\n--- Trial Phase by Sex Category (percentages) ---")
-            print(phase_sex_pct.round(1))
-            
-            # Calculate female inclusion rate by phase
-            female_inclusion_by_phase = {}
-            for phase in phase_sex.index:
-                total_trials = phase_sex.loc[phase].sum()
-                female_trials = 0
-                if 'Female Only' in phase_sex.columns:
-                    female_trials += phase_sex.loc[phase, 'Female Only']
-                if 'Both Sexes' in phase_sex.columns:
-                    female_trials += phase_sex.loc[phase, 'Both Sexes']
-                
-                rate = (female_trials / total_trials * 100).round(1) if total_trials > 0 else 0
-                female_inclusion_by_phase[phase] = rate
+            print(phase_sex_pct_rounded)
             
+            # Calculate female inclusion rate by phase, vectorized the
+            # same way as the per-disease rates above
+            phase_totals = phase_sex.sum(axis=1)
+            female_trials = (phase_sex
+                             .reindex(columns=['Female Only', 'Both Sexes'], fill_value=0)
+                             .sum(axis=1))
+            female_inclusion_by_phase = ((female_trials / phase_totals * 100)
+                                         .round(1)
+                                         .where(phase_totals > 0, 0)
+                                         .to_dict())
+
             detailed_stats['female_inclusion_by_phase'] = female_inclusion_by_phase
             
             print("\n--- Female Inclusion Rate by Trial Phase (%) ---")
@@ -306,26 +397,29 @@ def run_exploratory_analysis(df):
         if 'GII_Category' in df.columns:
             # Check if there's more than one GII category
             if df['GII_Category'].nunique() > 1:
-                plt.figure(figsize=(12, 7))
-                gii_sex = pd.crosstab(df['GII_Category'], df['Sex_Category'])
+                gii_sex = (df.groupby(['GII_Category', 'Sex_Category'], observed=False)
+                             .size()
+                             .unstack('Sex_Category', fill_value=0))
                 gii_sex_pct = gii_sex.div(gii_sex.sum(axis=1), axis=0) * 100
-                gii_sex_pct.plot(kind='bar', stacked=True, colormap='cividis')
-                plt.title('Distribution of Sex Categories by GII Level')
-                plt.ylabel('Percentage of Trials')
-                plt.xlabel('GII Category')
-                plt.legend(title='Sex Category')
-                plt.tight_layout()
-                plt.savefig('figures/sex_by_gii.png')
+                fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+                gii_sex_pct.plot(kind='bar', stacked=True, colormap='cividis', ax=ax)
+                ax.set_title('Distribution of Sex Categories by GII Level')
+                ax.set_ylabel('Percentage of Trials')
+                ax.set_xlabel('GII Category')
+                ax.legend(title='Sex Category')
+                fig.savefig('figures/sex_by_gii.png')
+                plt.close(fig)
                 
                 # Save detailed GII-sex cross-tabulation
+                gii_sex_pct_rounded = gii_sex_pct.round(1)
                 detailed_stats['gii_sex_counts'] = gii_sex.to_dict()
-                detailed_stats['gii_sex_percentages'] = gii_sex_pct.round(1).to_dict()
-                
+                detailed_stats['gii_sex_percentages'] = gii_sex_pct_rounded.to_dict()
+
                 print("\n--- GII Category by Sex Category (counts) ---")
                 print(gii_sex)
-                
+
                 print("\n--- GII Category by Sex Category (percentages) ---")
-                print(gii_sex_pct.round(1))
+                print(gii_sex_pct_rounded)
             else:
                 print("\nWARNING: Only one GII category found. GII analysis skipped.")
                 detailed_stats['gii_categories'] = df['GII_Category'].unique().tolist()
@@ -346,9 +440,9 @@ def run_exploratory_analysis(df):
     # 6. Summary statistics table
     summary_stats = {
         'Total Trials': len(df),
-        'Trials with Female Only': (df['Sex_Category'] == 'Female Only').sum(),
-        'Trials with Male Only': (df['Sex_Category'] == 'Male Only').sum(),
-        'Trials with Both Sexes': (df['Sex_Category'] == 'Both Sexes').sum(),
+        'Trials with Female Only': sex_counts.get('Female Only', 0),
+        'Trials with Male Only': sex_counts.get('Male Only', 0),
+        'Trials with Both Sexes': sex_counts.get('Both Sexes', 0),
         'Avg GII': df['Gender Inequality Index'].mean(),
         'Countries Represented': df['Country'].nunique()
     }
@@ -381,7 +475,10 @@ def run_statistical_analysis(df):
     
     # 1. Chi-square test for association between GII category and Sex category
     if 'GII_Category' in df.columns:
-        contingency_table = pd.crosstab(df['GII_Category'], df['Sex_Category'])
+        # Same integer-code groupby path as the exploratory crosstabs
+        contingency_table = (df.groupby(['GII_Category', 'Sex_Category'], observed=False)
+                               .size()
+                               .unstack('Sex_Category', fill_value=0))
         chi2, p, dof, expected = chi2_contingency(contingency_table)
         results['chi2_test'] = {
             'chi2': chi2,
@@ -426,87 +523,61 @@ def run_statistical_analysis(df):
             print(f"Error in logistic regression: {e}")
     
     # 3. Interaction analysis with disease type
-    # Create a model with interaction terms
+    # The formula interface builds the dummy and interaction design
+    # matrix internally, replacing the manual get_dummies/concat and
+    # per-column interaction products
     if len(regression_data) > 0 and 'Disease_Category' in regression_data.columns:
-        # Create dummy variables for disease categories
-        disease_dummies = pd.get_dummies(regression_data['Disease_Category'], prefix='disease', drop_first=True)
-        
-        # Add dummies to regression data
-        regression_data_with_dummies = pd.concat([regression_data, disease_dummies], axis=1)
-        
-        # Create interaction terms
-        for col in disease_dummies.columns:
-            regression_data_with_dummies[f"{col}_x_GII"] = regression_data_with_dummies[col] * regression_data_with_dummies['Gender Inequality Index']
-        
-        # Select predictor columns (GII, disease dummies, and interaction terms)
-        predictor_cols = ['Gender Inequality Index'] + list(disease_dummies.columns) + [col for col in regression_data_with_dummies.columns if '_x_GII' in col]
-        
-        # Add constant
-        X_interaction = sm.add_constant(regression_data_with_dummies[predictor_cols])
-        y = regression_data_with_dummies['Female_Inclusion']
-        
         try:
             # Fit model
-            interaction_model = sm.Logit(y, X_interaction)
-            interaction_result = interaction_model.fit()
-            
+            interaction_result = smf.logit(
+                'Female_Inclusion ~ Q("Gender Inequality Index") * C(Disease_Category)',
+                data=regression_data).fit()
+
             # Store and print results
             results['interaction_model'] = {
                 'params': interaction_result.params.to_dict(),
                 'pvalues': interaction_result.pvalues.to_dict()
             }
-            
+
             print("\nDisease-GII Interaction Model:")
             print("Significant interactions (p < 0.05):")
-            for col in predictor_cols:
-                if '_x_GII' in col and interaction_result.pvalues[col] < 0.05:
-                    disease = col.replace('_x_GII', '')
+            # ':' is the formula interaction separator
+            for col, p_value in interaction_result.pvalues.items():
+                if ':' in col and p_value < 0.05:
                     effect = "negative" if interaction_result.params[col] < 0 else "positive"
-                    print(f"  {disease}: {effect} interaction (coef={interaction_result.params[col]:.4f}, p={interaction_result.pvalues[col]:.4f})")
-        
+                    print(f"  {col}: {effect} interaction (coef={interaction_result.params[col]:.4f}, p={p_value:.4f})")
+
         except Exception as e:
             print(f"Error in interaction model: {e}")
     
     # 4. Interaction with trial phase
     if len(regression_data) > 0 and 'Standardized_Phase' in regression_data.columns:
-        # Create dummy variables for phase categories
-        # Exclude unknown phase
+        # Exclude unknown phase; dropping the unused category keeps the
+        # formula machinery from emitting an all-zero dummy column
         phase_data = regression_data[regression_data['Standardized_Phase'] != 'Unknown'].copy()
-        phase_dummies = pd.get_dummies(phase_data['Standardized_Phase'], prefix='phase', drop_first=True)
-        
-        # Add dummies to regression data
-        phase_data_with_dummies = pd.concat([phase_data, phase_dummies], axis=1)
-        
-        # Create interaction terms
-        for col in phase_dummies.columns:
-            phase_data_with_dummies[f"{col}_x_GII"] = phase_data_with_dummies[col] * phase_data_with_dummies['Gender Inequality Index']
-        
-        # Select predictor columns
-        phase_predictor_cols = ['Gender Inequality Index'] + list(phase_dummies.columns) + [col for col in phase_data_with_dummies.columns if '_x_GII' in col]
-        
-        # Add constant
-        X_phase = sm.add_constant(phase_data_with_dummies[phase_predictor_cols])
-        y_phase = phase_data_with_dummies['Female_Inclusion']
-        
+        if isinstance(phase_data['Standardized_Phase'].dtype, pd.CategoricalDtype):
+            phase_data['Standardized_Phase'] = (
+                phase_data['Standardized_Phase'].cat.remove_unused_categories())
+
         try:
             # Fit model
-            phase_model = sm.Logit(y_phase, X_phase)
-            phase_result = phase_model.fit()
-            
+            phase_result = smf.logit(
+                'Female_Inclusion ~ Q("Gender Inequality Index") * C(Standardized_Phase)',
+                data=phase_data).fit()
+
             # Store and print results
             results['phase_model'] = {
                 'params': phase_result.params.to_dict(),
                 'pvalues': phase_result.pvalues.to_dict()
             }
-            
+
             print("\nPhase-GII Interaction Model:")
             print("Significant interactions (p < 0.05):")
-            for col in phase_predictor_cols:
-                if '_x_GII' in col and phase_result.pvalues[col] < 0.05:
-                    phase = col.replace('_x_GII', '')
+            for col, p_value in phase_result.pvalues.items():
+                if ':' in col and p_value < 0.05:
                     effect = "negative" if phase_result.params[col] < 0 else "positive"
-                    print(f"  {phase}: {effect} interaction (coef={phase_result.params[col]:.4f}, p={phase_result.pvalues[col]:.4f})")
-        
+                    print(f"  {col}: {effect} interaction (coef={phase_result.params[col]:.4f}, p={p_value:.4f})")
+
         except Exception as e:
             print(f"Error in phase interaction model: {e}")
     
@@ -523,43 +594,66 @@ def analyze_sex_representation_equity(df):
     """
     # US population sex ratio (as of 2025 estimates)
     EXPECTED_FEMALE_RATIO = 0.508  # 50.8% female in general population
-    
+
+    # Count trials per (disease, sex) in one pass instead of
+    # re-filtering the frame for every disease
+    sex_counts = (df.groupby('Disease_Category', observed=True)['Sex_Category']
+                    .value_counts()
+                    .unstack(fill_value=0))
+    total_trials = sex_counts.sum(axis=1)
+    sex_counts = sex_counts.reindex(
+        columns=['Both Sexes', 'Female Only', 'Male Only'], fill_value=0)
+
+    # Vectorize the participation arithmetic across all diseases
+    both_sex = sex_counts['Both Sexes']
+    female_only = sex_counts['Female Only']
+    male_only = sex_counts['Male Only']
+
+    # Expected female participation
+    total_potential = (both_sex * 2) + female_only + male_only
+    expected_female = total_potential * EXPECTED_FEMALE_RATIO
+
+    # Actual maximum female participation (assuming equal split in both-sex trials)
+    actual_female = both_sex + female_only
+
+    # Chi-square test on the 2x2 [observed, expected] table, computed
+    # for all diseases at once but numerically identical to the
+    # per-disease chi2_contingency calls it replaces: both rows of each
+    # table sum to total_potential, so the margin-derived expected cell
+    # is simply the mean of its column, and the Yates continuity
+    # correction (applied by chi2_contingency whenever dof is 1) moves
+    # each observed cell up to 0.5 toward it
+    tables = np.stack([
+        np.column_stack([actual_female, total_potential - actual_female]),
+        np.column_stack([expected_female, total_potential - expected_female]),
+    ], axis=1)
+    expected_cells = tables.mean(axis=1, keepdims=True)
+    shift = expected_cells - tables
+    corrected = tables + np.sign(shift) * np.minimum(0.5, np.abs(shift))
+    chi2_stats = ((corrected - expected_cells) ** 2 / expected_cells).sum(axis=(1, 2))
+    p_values = chi2_dist.sf(chi2_stats, df=1)
+
     # Analysis by disease type
     results = {}
-    
-    for disease in df['Disease_Category'].unique():
-        disease_trials = df[df['Disease_Category'] == disease]
-        
-        # Calculate total participants that could be female
-        total_both_sex = len(disease_trials[disease_trials['Sex_Category'] == 'Both Sexes'])
-        female_only = len(disease_trials[disease_trials['Sex_Category'] == 'Female Only'])
-        male_only = len(disease_trials[disease_trials['Sex_Category'] == 'Male Only'])
-        
-        # Expected female participation
-        total_potential_participants = (total_both_sex * 2) + female_only + male_only
-        expected_female = total_potential_participants * EXPECTED_FEMALE_RATIO
-        
-        # Actual maximum female participation (assuming equal split in both-sex trials)
-        actual_female = (total_both_sex) + female_only
-        
-        # Chi-square test
-        observed = [actual_female, total_potential_participants - actual_female]
-        expected = [expected_female, total_potential_participants - expected_female]
-        chi2, p_value = chi2_contingency([observed, expected])[0:2]
-        
+    for i, disease in enumerate(sex_counts.index):
+        expected = expected_female[disease]
+        actual = actual_female[disease]
+        chi2 = chi2_stats[i]
+        p_value = p_values[i]
+
         results[disease] = {
-            'total_trials': len(disease_trials),
-            'both_sex_trials': total_both_sex,
-            'female_only_trials': female_only,
-            'male_only_trials': male_only,
-            'potential_female_ratio': actual_female / total_potential_participants,
+            'total_trials': total_trials[disease],
+            'both_sex_trials': both_sex[disease],
+            'female_only_trials': female_only[disease],
+            'male_only_trials': male_only[disease],
+            'potential_female_ratio': actual / total_potential[disease],
             'expected_female_ratio': EXPECTED_FEMALE_RATIO,
             'chi2_statistic': chi2,
             'p_value': p_value,
             'significant_difference': p_value < 0.05,
-            'direction': 'over-representation' if actual_female > expected_female else 'under-representation' if actual_female < expected_female else 'equal'
+            'direction': 'over-representation' if actual > expected else 'under-representation' if actual < expected else 'equal'
         }
-    
+
     return results
 
 # -------------------------------------------------
@@ -568,26 +662,33 @@ def analyze_sex_representation_equity(df):
 
 # This maintains the original functionality of the starter.py script
 
+# Bounded worker count doubles as the rate limit: at most this many
+# requests are in flight against clinicaltrials.gov at once
+_FETCH_WORKERS = 10
+
 def fetch_eligibility_data(df, n_trials=100):
     print(f"\nFetching eligibility criteria for {n_trials} trials...")
     # Ensure we have a column with NCT IDs
     nct_ids = df["NCT Number_trial"].dropna().unique()
-    
+
     # Limit to n_trials
     if len(nct_ids) > n_trials:
         nct_ids = nct_ids[:n_trials]
-    
-    # Fetch eligibility text
-    eligibility_texts = []
-    for nct_id in nct_ids:
-        text = fetch_eligibility(nct_id)
-        eligibility_texts.append({"NCT Number_trial": nct_id, "Eligibility Criteria": text})
-        time.sleep(0.5)  # Respectful delay
-    
+
+    # Each fetch is independent network I/O, so run them through a
+    # thread pool instead of serially with a sleep between requests;
+    # total wall time drops from ~1s per trial to ~1s per batch of
+    # _FETCH_WORKERS trials
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        eligibility_texts = list(executor.map(fetch_eligibility, nct_ids))
+
     # Create DataFrame and merge
-    eligibility_df = pd.DataFrame(eligibility_texts)
+    eligibility_df = pd.DataFrame({
+        "NCT Number_trial": nct_ids,
+        "Eligibility Criteria": eligibility_texts,
+    })
     df_with_eligibility = pd.merge(df, eligibility_df, on="NCT Number_trial", how="left")
-    
+
     return df_with_eligibility
 
 # --------------------------
@@ -636,8 +737,18 @@ if __name__ == "__main__":
     # Fetch eligibility criteria for a subset of trials
     df_with_eligibility = fetch_eligibility_data(df_clean, n_trials=50)  # Limiting to 50 for demonstration
     
-    # Save processed data to files
+    # Save processed data to files. Parquet is the primary output: it
+    # keeps the dictionary-encoded categoricals, compresses far smaller
+    # and reloads without re-parsing; the CSVs stay as the portable
+    # copies the other scripts and collaborators read
     print("\nSaving processed data to files...")
+    try:
+        df_clean.to_parquet("processed_clinical_trials.parquet",
+                            compression='zstd', index=False)
+        df_with_eligibility.to_parquet("clinical_trials_with_eligibility.parquet",
+                                       compression='zstd', index=False)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Parquet export skipped: {e}")
     df_clean.to_csv("processed_clinical_trials.csv", index=False)
     df_with_eligibility.to_csv("clinical_trials_with_eligibility.csv", index=False)
     